@@ -19,7 +19,6 @@ Inhereted attributes (characteristics):
     - Fitness
 
 Inhereted class variables and methods
-    - migrated
     - param, determined by subclass
     - set_params()
 
@@ -60,6 +59,233 @@ __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 import math
 import random
 
+import numpy as np
+
+try:  # Numba is optional; the scalar kernels below work without it
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when Numba is not installed."""
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+@njit(cache=True)
+def _fastexp(x):
+    """
+    Fast polynomial approximation of `math.exp` for small arguments.
+
+    Uses an 8-term Horner polynomial (the truncated Taylor series scaled
+    by 8!), which is accurate to roughly 1e-5 for `|x| < 1` — far more
+    precision than the fitness probabilities need. Larger arguments fall
+    back to `math.exp`, so no range reduction is done here.
+
+    Parameters
+    ----------
+    x : float
+        The exponent.
+
+    Returns
+    -------
+    float
+        An approximation of e**x.
+
+    """
+    if -1.0 < x < 1.0:
+        return (40320 + x * (40320 + x * (20160 + x * (6720 + x * (1680 + x * (336 + x * (56 + x * (8 + x)))))))) \
+               * 2.4801587301587302e-05
+    return math.exp(x)
+
+
+@njit(cache=True)
+def _fitness(age, weight, phi_age, a_half, phi_weight, w_half):
+    """
+    Scalar fitness kernel, kept free of attribute and dict lookups.
+
+    With Numba installed this compiles to a straight-line floating-point
+    kernel; without it the function runs as plain Python.
+
+    Parameters
+    ----------
+    age, weight : float
+        Animal age and weight.
+    phi_age, a_half, phi_weight, w_half : float
+        Species parameters, see `Animal.set_params`.
+
+    Returns
+    -------
+    float
+        Fitness value in the interval [0, 1].
+
+    """
+    if weight <= 0:
+        return 0.0
+    age_var = 1.0 / (1.0 + _fastexp(phi_age * (age - a_half)))
+    weigh_var = 1.0 / (1.0 + _fastexp(-1.0 * phi_weight * (weight - w_half)))
+    return age_var * weigh_var
+
+
+@njit(cache=True)
+def _eat_prey(weights, killed, appetite):
+    """
+    Jittable eating loop over prey weight and kill-decision arrays.
+
+    Walks the prey in order, consuming killed prey until the appetite is
+    reached. The final kill that satisfies the carnivore counts as a full
+    appetite, matching the original eating rules.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray of float
+        Prey weights, in hunting order.
+    killed : numpy.ndarray of bool
+        Pre-drawn kill decision per prey.
+    appetite : float
+        The carnivore parameter `param['F']`.
+
+    Returns
+    -------
+    tuple of (float, numpy.ndarray of bool)
+        Total food consumed and a survivor mask over the prey.
+
+    """
+    consumed = 0.0
+    eaten_food = 0.0
+    alive = np.ones(weights.size, np.bool_)
+    for i in range(weights.size):
+        if killed[i] and eaten_food < appetite:
+            if eaten_food + weights[i] < appetite:
+                eaten_food += weights[i]
+                consumed += weights[i]
+                alive[i] = False
+            else:  # the satisfying kill counts as a full appetite
+                consumed += appetite
+                alive[i] = False
+                break
+    return consumed, alive
+
+
+def update_fitness_all(anim_pop):
+    """
+    Recompute fitness for a whole population in one vectorized pass.
+
+    The ages and weights of all animals are gathered into contiguous
+    NumPy arrays, the fitness sigmoid is evaluated once for the whole
+    cohort with `numpy.exp`, and the results are written back to each
+    animal. This is equivalent to calling `fitness_update` per animal,
+    but avoids the per-animal interpreter overhead.
+
+    Parameters
+    ----------
+    anim_pop : list of class objects
+        Animal population of a single species. All animals must share
+        the same parameters (`param`).
+
+    See Also
+    --------
+    Animal.fitness_update :
+        calculates animal fitness based on animal age and weight.
+
+    """
+    if not anim_pop:
+        return
+
+    param = anim_pop[0].param
+    ages = np.fromiter((anim.age for anim in anim_pop), dtype=np.float64, count=len(anim_pop))
+    weights = np.fromiter((anim.weight for anim in anim_pop), dtype=np.float64, count=len(anim_pop))
+
+    age_var = 1 / (1 + np.exp(param['phi_age'] * (ages - param['a_half'])))
+    weight_var = 1 / (1 + np.exp(-1 * param['phi_weight'] * (weights - param['w_half'])))
+    fitness = age_var * weight_var
+    fitness[weights <= 0] = 0  # animals without weight are not alive
+
+    for anim, fit in zip(anim_pop, fitness):
+        anim.fitness = fit
+
+
+def annual_tick_pop(anim_pop):
+    """
+    Columnar aging, weight loss and fitness update for a population.
+
+    The per-animal loop of `age_change` + `weight_loss` calls is replaced
+    by one gather of ages and weights into NumPy columns, vectorized
+    arithmetic on the columns, and one scatter of the results back to the
+    animals. The arithmetic matches the scalar methods exactly.
+
+    Parameters
+    ----------
+    anim_pop : list of class objects
+        Animal population of a single species. All animals must share
+        the same parameters (`param`).
+
+    See Also
+    --------
+    Animal.annual_tick :
+        the scalar fused aging and weight-loss update.
+
+    """
+    if not anim_pop:
+        return
+
+    param = anim_pop[0].param
+    n = len(anim_pop)
+    ages = np.fromiter((anim.age for anim in anim_pop), dtype=np.int64, count=n) + 1
+    weights = np.fromiter((anim.weight for anim in anim_pop), dtype=np.float64, count=n)
+    weights -= param['eta'] * weights
+
+    age_var = 1 / (1 + np.exp(param['phi_age'] * (ages - param['a_half'])))
+    weight_var = 1 / (1 + np.exp(-1 * param['phi_weight'] * (weights - param['w_half'])))
+    fitness = age_var * weight_var
+    fitness[weights <= 0] = 0  # animals without weight are not alive
+
+    for anim, age, weight, fit in zip(anim_pop, ages, weights, fitness):
+        anim.age = age
+        anim.weight = weight
+        anim.fitness = fit
+
+
+def filter_survivors(anim_pop):
+    """
+    Columnar annual death decision for a population.
+
+    Weights and fitness are gathered into NumPy columns and the death
+    predicate — zero weight, or a uniform roll below
+    ``omega * (1 - fitness)`` — is evaluated for the whole population in
+    one vectorized expression, matching `Animal.dying` per animal.
+
+    Parameters
+    ----------
+    anim_pop : list of class objects
+        Animal population of a single species. All animals must share
+        the same parameters (`param`).
+
+    Returns
+    -------
+    list of class objects
+        The animals that survive this year.
+
+    See Also
+    --------
+    Animal.dying :
+        the scalar per-animal death decision.
+
+    """
+    if not anim_pop:
+        return anim_pop
+
+    param = anim_pop[0].param
+    n = len(anim_pop)
+    weights = np.fromiter((anim.weight for anim in anim_pop), dtype=np.float64, count=n)
+    fitness = np.fromiter((anim.fitness for anim in anim_pop), dtype=np.float64, count=n)
+
+    deaths = (weights <= 0) | (np.random.random(n) < param['omega'] * (1 - fitness))
+    if not deaths.any():
+        return anim_pop
+    return [anim for anim, dead in zip(anim_pop, deaths) if not dead]
+
 
 class Animal:
     """
@@ -88,6 +314,9 @@ class Animal:
     fitness : float
         A value in the interval 0 to 1, calculated based on the animal `weight`
         and `age`.
+    migrated : int
+        Migration epoch of the animal's last move; the island compares it
+        against the current year's epoch, so no yearly reset is needed.
 
     Note
     ----
@@ -96,8 +325,11 @@ class Animal:
 
     """
 
+    # Slots replace the per-instance __dict__; with populations in the
+    # 10^5 range the per-animal dict dominates memory use.
+    __slots__ = ('age', 'weight', 'fitness', 'migrated')
+
     param = None  #: (`dict`) - class variable with parameters used in methods
-    migrated = False  #: (`bool`) - class variable; `True` if animal has migrated
 
     @classmethod
     def set_params(cls, new_params):
@@ -132,19 +364,54 @@ class Animal:
             eta is outside the interval [0,1].
 
         """
+        cls_param = cls.param  # hoisted; the loop otherwise re-reads the class attribute
+        # validate every key before writing any, so a rejected call
+        # leaves param and the derived cache untouched and consistent
         try:
-            for k in new_params:
-                if k not in cls.param:
+            for k, value in new_params.items():
+                if k not in cls_param:
                     raise ValueError('Invalid parameter name: ' + k)
-                if new_params[k] < 0:
+                if value < 0:
                     raise ValueError('All parameters has to be positive')
-                if k == 'w_birth' and new_params[k] == 0:
+                if k == 'w_birth' and value == 0:
                     raise ValueError('Parameter "w_birth" cannot be zero')
-                if k == 'eta' and new_params[k] > 1:
+                if k == 'eta' and value > 1:
                     raise ValueError('Parameter "eta" must be in interval [0,1]')
-                cls.param[k] = float(new_params[k])
         except TypeError:
             raise ValueError('The value of the param must be an int or a float')
+        for k, value in new_params.items():
+            cls_param[k] = float(value)
+        cls._refresh_derived()
+
+    @classmethod
+    def _refresh_derived(cls):
+        """
+        Refresh values derived from `param`.
+
+        Combinations of parameters that are constant between parameter
+        changes are precomputed here, so the hot per-animal methods read
+        a single class attribute instead of redoing dict lookups and
+        arithmetic. Must be called after `param` changes; `set_params`
+        does so automatically.
+
+        """
+        cls._birth_weight_threshold = cls.param['zeta'] * (cls.param['w_birth'] + cls.param['sigma_birth'])
+        cls._DeltaPhiMax_inv = 1.0 / cls.param.get('DeltaPhiMax', 1.0)
+        cls.reset_birth_pool()  # pooled birth weights were drawn with the old parameters
+
+    @classmethod
+    def reset_birth_pool(cls):
+        """
+        Drop the pooled birth weights.
+
+        The pool caches random draws, so anything that re-seeds the
+        RNGs must drop it as well - otherwise the next newborns consume
+        weights drawn under the previous seed and same-seed runs
+        diverge. `_refresh_derived` drops it too, since the pooled
+        weights also depend on `param`.
+
+        """
+        cls._birth_pool = []
 
     def __init__(self, age=0, weight=None):
         # control of user input
@@ -157,8 +424,13 @@ class Animal:
 
         self.age = age  # set animal age to given input or default 0
         if weight is None:  # set animal weight depending on user input
-            # weight set to random value from a Gaussian distribution
-            self.weight = random.gauss(self.param['w_birth'], self.param['sigma_birth'])
+            # weight drawn from a pool of Gaussian birth weights; the pool is
+            # refilled in one vectorized batch rather than one gauss per newborn
+            pool = self._birth_pool
+            if not pool:
+                draws = np.random.normal(self.param['w_birth'], self.param['sigma_birth'], 4096)
+                pool.extend(draws[draws > 0])
+            self.weight = pool.pop()
         else:
             # weight set to user input
             self.weight = weight
@@ -166,6 +438,8 @@ class Animal:
         # set animal fitness by calculating fitness
         self.fitness = self.fitness_update()
 
+        self.migrated = 0  # epoch of the last move; compared, never reset
+
     def __repr__(self):
         """
         Check object type of animal
@@ -178,13 +452,20 @@ class Animal:
         """
         return f'{type(self).__name__}()'
 
-    def age_change(self):  # should be called aging?
+    def age_change(self, update_fitness=True):  # should be called aging?
         """
         Increase animal age by one.
 
         As a result of changing the animal age,
         animal fitness is recalculated and updated.
 
+        Parameters
+        ----------
+        update_fitness : bool, default True
+            If `False` the fitness recalculation is skipped, so a caller
+            updating a whole population can recompute fitness in one
+            batch afterwards. See `update_fitness_all`.
+
         See Also
         --------
         fitness_update :
@@ -199,9 +480,28 @@ class Animal:
 
         """
         self.age += 1
+        if update_fitness:
+            self.fitness = self.fitness_update()
+
+    def annual_tick(self):
+        """
+        Fused annual aging and weight loss.
+
+        Increases the animal age by one and applies the annual weight
+        loss in a single pass, so fitness is only recalculated once
+        instead of after each of the two changes.
+
+        See Also
+        --------
+        age_change, weight_loss :
+            the two separate life events fused here.
+
+        """
+        self.age += 1
+        self.weight -= self.param['eta'] * self.weight
         self.fitness = self.fitness_update()
 
-    def birth(self, num_animals):
+    def birth(self, num_animals, roll=None):
         """
         Decide if an animal gives birth.
 
@@ -227,6 +527,10 @@ class Animal:
             Number of animals of the same species in one location. If
             `num_animals` < 2, the probability of birth is 0. Meaning
             that the animal do not give birth.
+        roll : float, optional
+            A pre-drawn uniform random number in [0, 1). If not given, a
+            fresh number is drawn; callers deciding birth for a whole
+            population can draw all rolls in one vectorized batch.
 
         Returns
         -------
@@ -250,43 +554,31 @@ class Animal:
 
         """
 
-        def _birth_weightloss(_newborn):
-            """
-            Calculate the weight loss when giving birth.
-
-            The newborn weight is parameterized with `param['xi']
-            to calculate the weight loss
-
-            Parameters
-            ----------
-            _newborn : class object
-                A class object that is born if animals give birth.
-
-            Returns
-            -------
-            float
-                The animals weight loss if the animal gives birth.
-            """
-            return self.param['xi'] * _newborn.weight
-
-        # Check the animals weight with parameterized minimum weight
-        if self.weight < self.param['zeta'] * (self.param['w_birth']
-                                               + self.param['sigma_birth']):
-            p = 0
-        else:  # calculate the probability [0, 1) of giving birth
-            p = min(1, self.param['gamma'] * self.fitness * (num_animals - 1))
-
-        if random.random() < p:  # check if random number is higher then p
+        param = self.param  # hoisted; avoids repeated dict lookups through the attribute
+
+        # No RNG draw when the probability is certain to be 0: the animal
+        # is below the parameterized minimum weight or alone in the cell
+        if self.weight < self._birth_weight_threshold or num_animals < 2:
+            return None
+
+        # calculate the probability [0, 1) of giving birth
+        p = min(1, param['gamma'] * self.fitness * (num_animals - 1))
+
+        if roll is None:
+            roll = random.random()
+        if roll < p:  # check if random number is higher then p
             newborn = type(self)()  # creates a newborn of same class as animal
+            # weight loss when giving birth; the newborn weight parameterized with `param['xi']`
+            loss = param['xi'] * newborn.weight
             # checks if newborn weighs less the animal and more then 0
-            if _birth_weightloss(newborn) < self.weight and newborn.weight > 0:
-                self.weight -= _birth_weightloss(newborn)  # animal looses weight
+            if loss < self.weight and newborn.weight > 0:
+                self.weight -= loss  # animal looses weight
                 self.fitness = self.fitness_update()  # animal fitness updated
                 return newborn  # if animal give birth
 
         return None  # if the animal do not give birth
 
-    def dying(self):
+    def dying(self, roll=None):
         """
         Check if the animal dies.
 
@@ -294,6 +586,13 @@ class Animal:
         parameter `param['omega']`. If the animal's weight is
         equal to 0 or bellow the animal dies with certainty.
 
+        Parameters
+        ----------
+        roll : float, optional
+            A pre-drawn uniform random number in [0, 1). If not given, a
+            fresh number is drawn; callers deciding death for a whole
+            population can draw all rolls in one vectorized batch.
+
 
         Returns
         -------
@@ -308,12 +607,12 @@ class Animal:
         Anim is dead == True
 
         """
-        p = self.param['omega'] * (1 - self.fitness)  # Calculate the probability of death
         if self.weight <= 0:  # Dies with certainty of the weight is 0 or bellow
             return True
-        else:
-            # Generate random number [0,1), to decide if animal dies.
-            return random.random() < p
+        if roll is None:  # draw a number [0,1) unless one was supplied
+            roll = random.random()
+        # Calculate the probability of death; only reached for live animals
+        return roll < self.param['omega'] * (1 - self.fitness)
 
     def fitness_update(self):
         """
@@ -340,13 +639,11 @@ class Animal:
         anim has a fitness equal to 0.880797
 
         """
-        if self.weight <= 0:
-            return 0
-        age_var = (1 / (1 + math.exp(self.param['phi_age'] * (self.age - self.param['a_half']))))
-        weigh_var = (1 / (1 + math.exp(-1 * self.param['phi_weight'] * (self.weight - self.param['w_half']))))
-        return age_var * weigh_var
+        param = self.param
+        return _fitness(self.age, self.weight, param['phi_age'], param['a_half'],
+                        param['phi_weight'], param['w_half'])
 
-    def migrate(self):
+    def migrate(self, roll=None):
         """
         Check if animal wants to migrate.
 
@@ -354,6 +651,13 @@ class Animal:
         is lower then the probability of moving. The probability of moving
         is determined by `param['mu']` and the animal fitness.
 
+        Parameters
+        ----------
+        roll : float, optional
+            A pre-drawn uniform random number in [0, 1). If not given, a
+            fresh number is drawn; callers deciding migration for a whole
+            population can draw all rolls in one vectorized batch.
+
         Returns
         -------
         bool
@@ -368,7 +672,9 @@ class Animal:
 
         """
         p = self.param['mu'] * self.fitness  # calculate probability of moving
-        return random.random() < p  # random generated number to determine if animal moves
+        if roll is None:  # draw a number [0,1) unless one was supplied
+            roll = random.random()
+        return roll < p
 
     def weight_gain(self, consumed_food):  # eat_weight_gain / wgt_gain_eat
         """
@@ -397,16 +703,38 @@ class Animal:
         anim increased the weight from 17 to 24.2 due to eating
 
         """
-        self.weight += self.param['beta'] * consumed_food
+        self._raw_weight_gain(consumed_food)
         self.fitness = self.fitness_update()
 
-    def weight_loss(self):  # aging_weight_loss?
+    def _raw_weight_gain(self, consumed_food):
         """
-        Loss of weight do to annual lifecycle / aging. 
-        
+        Add the weight gained from eating without touching fitness.
+
+        Used in tight eating loops where the fitness update is deferred
+        to a single call at the end; see `Carnivore.eat_herb`.
+
+        Parameters
+        ----------
+        consumed_food : int, float
+            The amount of food consumed by the animal.
+
+        """
+        self.weight += self.param['beta'] * consumed_food
+
+    def weight_loss(self, update_fitness=True):  # aging_weight_loss?
+        """
+        Loss of weight do to annual lifecycle / aging.
+
         Determined by the animals weight and `param['eta']`. The animals
         fitness us updated do to change in weight.
 
+        Parameters
+        ----------
+        update_fitness : bool, default True
+            If `False` the fitness recalculation is skipped, so a caller
+            updating a whole population can recompute fitness in one
+            batch afterwards. See `update_fitness_all`.
+
         Examples
         --------
         >>> anim = Herbivore(age=35, weight=17)
@@ -417,7 +745,8 @@ class Animal:
 
         """
         self.weight -= self.param['eta'] * self.weight
-        self.fitness = self.fitness_update()
+        if update_fitness:
+            self.fitness = self.fitness_update()
 
 
 class Carnivore(Animal):
@@ -445,6 +774,8 @@ class Carnivore(Animal):
 
     """
 
+    __slots__ = ()  # keep instances dict-free; all state lives in Animal's slots
+
     param = dict(w_birth=6.0, sigma_birth=1.0, beta=0.75, eta=0.125,
                  a_half=40.0, phi_age=0.3, w_half=4.0, phi_weight=0.4,
                  mu=0.4, gamma=0.8, zeta=3.5, xi=1.1, omega=0.8, F=50.0,
@@ -469,8 +800,8 @@ class Carnivore(Animal):
         Parameters
         ----------
         available_prey : list of Herbivore objects
-            List of available Herbivores (prey), at the same location as Carnivore
-            and shuffled in random order.
+            List of available Herbivores (prey), at the same location as the
+            Carnivore and sorted from low to high fitness.
 
 
         Returns
@@ -485,32 +816,40 @@ class Carnivore(Animal):
             weight and fitness level.
 
         """
-        eaten_food = 0  # Control of amount of Herbivore eaten - measured in Herbivore weight, start level
-        herb_survivors = []  # List of surviving herbivores
-
-        for i, herb in enumerate(available_prey):
-            # If fitness level of Carn is lower than Herb, the Carn cannot kill any more herbs, and we return survivors
-            if self.fitness <= herb.fitness:
-                # If fitness is too low, return survivors
-                return herb_survivors + available_prey[i:]
-
-            elif 0 < self.fitness - herb.fitness < self.param['DeltaPhiMax']:  # Difference in fitness level
-                # Probability for a carnivore to kill a herbivore
-                p = (self.fitness - herb.fitness) / self.param['DeltaPhiMax']
-                # With the given probability check if the Carnivore eats the Herbivore
-                if random.random() < p and eaten_food < self.param['F']:  # Check if Carnivore is already satisfied
-                    if eaten_food + herb.weight < self.param['F']:
-                        self.weight_gain(herb.weight)  # increase Carnivore weight and update fitness
-                        eaten_food += herb.weight  # increase amount eaten to eaten_food
-                    else:
-                        self.weight_gain(self.param['F'])
-                        # If satisfied, return the survivors
-                        return herb_survivors + available_prey[i + 1:]
-                else:
-                    herb_survivors.append(herb)  # Herbivore not eaten added to list of survivers
-            # Else the carnivore kills the herb with p = 1
-
-        return herb_survivors
+        delta_phi_max = self.param['DeltaPhiMax']  # hoisted param lookups for the loop
+        appetite = self.param['F']
+
+        # Since prey is sorted by fitness, every herb from the first one at
+        # least as fit as the Carnivore is a guaranteed survivor. Gather the
+        # fitness values once, locate that herb with searchsorted and only
+        # hunt the prefix of killable prey. (bisect.bisect_left could find
+        # the cut too, but its key= argument needs Python 3.10.)
+        fits_all = np.fromiter((herb.fitness for herb in available_prey),
+                               dtype=np.float64, count=len(available_prey))
+        cut = int(np.searchsorted(fits_all, self.fitness, side='left'))
+        safe_prey = available_prey[cut:]  # too fit to be killed
+        prey = available_prey[:cut]
+
+        # Fitness differences, kill probabilities and random rolls are computed
+        # in one vectorized batch at entry instead of per prey in the loop
+        fits = fits_all[:cut]
+        diff = self.fitness - fits
+        p = np.clip(diff * self._DeltaPhiMax_inv, 0, 1)  # Probability for a carnivore to kill each herbivore
+        rolls = np.random.random(fits.size)
+        # The kill decision per herb as one boolean mask: the probability
+        # roll, with an absolute kill (p = 1) when diff >= DeltaPhiMax
+        killed = (rolls < p) | (diff >= delta_phi_max)
+
+        weights = np.fromiter((herb.weight for herb in prey),
+                              dtype=np.float64, count=len(prey))
+        consumed, alive = _eat_prey(weights, killed, appetite)
+
+        if consumed:  # one weight gain and fitness update for the whole meal
+            self._raw_weight_gain(consumed)
+            self.fitness = self.fitness_update()
+
+        herb_survivors = [herb for herb, keep in zip(prey, alive) if keep]
+        return herb_survivors + safe_prey
 
 
 class Herbivore(Animal):
@@ -537,6 +876,8 @@ class Herbivore(Animal):
     anim is 10 years old, weighs 30 and have 0.8807970645633608 fitness
 
     """
+    __slots__ = ()  # keep instances dict-free; all state lives in Animal's slots
+
     param = dict(w_birth=8.0, sigma_birth=1.5, beta=0.9, eta=0.05, a_half=40.0,
                  phi_age=0.6, w_half=10.0, phi_weight=0.1, mu=0.25, gamma=0.2,
                  zeta=3.5, xi=1.2, omega=0.4, F=10.0)  #: dict of str : Herbivore param to parameterize methods
@@ -572,13 +913,13 @@ class Herbivore(Animal):
             weight and fitness level.
 
         """
-        consumed_fodder = self.param['F']  # Amount of fodder to satisfy Herbivore
-        if cell_fodder_amount == 0:  # No fodder in the cell/location of the Herbivore
-            return 0
-        elif cell_fodder_amount < consumed_fodder:  # Amount available is less then amount of fodder to satisfy
-            consumed_fodder = cell_fodder_amount  # Herbivore eats remaining fodder in cell/location
-            self.weight_gain(consumed_fodder)  # Herbivore gains weight
-            return consumed_fodder
-        else:  # Amount in cell is enough to satisfy Herbivore
+        # min() covers both eating to satisfaction and eating the remains
+        consumed_fodder = min(cell_fodder_amount, self.param['F'])
+        if consumed_fodder:  # no weight gain when the cell is out of fodder
             self.weight_gain(consumed_fodder)  # Herbivore gains weight
-            return consumed_fodder
+        return consumed_fodder
+
+
+# Initialize the precomputed parameter combinations for the default `param`
+for _cls in (Herbivore, Carnivore):
+    _cls._refresh_derived()
@@ -21,10 +21,65 @@ files.
 __author__ = 'Therese Aase Knapskog and Astrid Moum'
 __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 
+import os
+import subprocess
+import time
+
+try:  # enlarging the kernel pipe buffer is a Linux-only optimization
+    import fcntl
+    F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+except ImportError:
+    fcntl = None
+
+import matplotlib
+
+# With no display there is no GUI to drive; the Agg backend skips all
+# GUI widget setup, which makes figure and axes creation much cheaper.
+# An explicit MPLBACKEND choice from the user is left untouched.
+if not os.environ.get('DISPLAY') and not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
-import subprocess
-import os
+
+try:  # fast-histogram is optional; numpy covers the same need below
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+
+def _hist_counts(data, nbins, hist_range):
+    """
+    Histogram counts over regular-width bins.
+
+    Uses `fast_histogram.histogram1d` when the package is installed,
+    which is several times faster than `np.histogram` for regular bins;
+    otherwise the bins are regular so the counts come from `np.bincount`
+    over precomputed integer bin indices, which skips the bin search
+    `np.histogram` would do. Only the counts are returned, matching what
+    the histogram lines need.
+
+    Parameters
+    ----------
+    data : array-like
+        The values to count.
+    nbins : int
+        Number of bins.
+    hist_range : tuple of float
+        The (min, max) range covered by the bins.
+
+    Returns
+    -------
+    numpy.ndarray
+        Count per bin.
+
+    """
+    if histogram1d is not None:
+        return histogram1d(data, bins=nbins, range=hist_range)
+    lo, hi = hist_range
+    idx = np.floor((data - lo) * (nbins / (hi - lo))).astype(np.intp)
+    idx[data == hi] = nbins - 1  # right edge is inclusive, as in np.histogram
+    return np.bincount(idx[(idx >= 0) & (idx < nbins)], minlength=nbins)
 
 # Update these variables to point to your ffmpeg and convert binaries
 # If you installed ffmpeg using conda or installed both software in
@@ -39,6 +94,60 @@ _DEFAULT_FILEBASE = os.path.join('..', 'data')
 _DEFAULT_IMG_FORMAT = 'png'
 _DEFAULT_MOVIE_FORMAT = 'mp4'  # alternatives: mp4, gif
 
+# default plot parameters; user arguments are overlaid on a copy of
+# this table in __init__, so every key is always present downstream
+_DEFAULT_PARAM = {
+    'ymax_anim': None,
+    'cmax_anim': None,
+    'age_lim_bins': np.arange(0, 1.0, 0.05),
+    'wgt_lim_bins': np.arange(0, 60.0, 2),
+    'fit_lim_bins': np.arange(0, 60.0, 2),
+    'age_xlim': 1.0,
+    'wgt_xlim': 60.0,
+    'fit_xlim': 60.0,
+}
+
+# hist_specs uses the full property names; self.param the short ones
+_HIST_ALIAS = {'age': 'age', 'weight': 'wgt', 'fitness': 'fit'}
+
+_h264_args = None  # cached by _h264_encoder_args
+
+
+def _h264_encoder_args():
+    """
+    Pick the fastest available H.264 encoder.
+
+    Asks ffmpeg once which encoders it was built with and prefers the
+    hardware encoders (NVENC, then Quick Sync), which offload the
+    encoding to fixed-function silicon and are typically several times
+    faster than software encoding. Falls back to libx264 when no
+    hardware encoder is listed or ffmpeg cannot be run. VAAPI is not
+    probed, as it needs a render device and an upload filter chain
+    that cannot be assumed here.
+
+    Returns
+    -------
+    list of str
+        ffmpeg output arguments selecting the encoder.
+
+    """
+    global _h264_args
+    if _h264_args is None:
+        try:
+            listing = subprocess.run(
+                [_FFMPEG_BINARY, '-hide_banner', '-encoders'],
+                capture_output=True, text=True).stdout
+        except OSError:
+            listing = ''
+        if 'h264_nvenc' in listing:
+            _h264_args = ['-c:v', 'h264_nvenc',
+                          '-preset', 'p4', '-rc', 'vbr', '-cq', '23']
+        elif 'h264_qsv' in listing:
+            _h264_args = ['-c:v', 'h264_qsv']
+        else:
+            _h264_args = ['-c:v', 'libx264', '-preset', 'veryfast']
+    return _h264_args
+
 
 class Graphics:
     """Provides graphics interface for simulation.
@@ -75,6 +184,10 @@ class Graphics:
         img_no are consecutive image numbers starting from 0.
     img_fmt : str, default 'png'
         File type for figure/images saved.
+    stream_movie : bool, default False
+        If `True`, every saved frame is also piped as raw pixels into a
+        persistent ffmpeg process, so :py:meth:`make_movie` can finalize
+        the mp4 without re-reading the saved images.
 
     Attributes
     ----------
@@ -101,43 +214,29 @@ class Graphics:
     """
 
     def __init__(self, ymax_animals=None, cmax_animals=None, hist_specs=None,
-                 img_base=None, img_fmt='png'):
-        self.param = {}
-        if ymax_animals is not None:  # check is user have set parameter ymax_animals
+                 img_base=None, img_fmt='png', stream_movie=False):
+        # overlay user arguments on the default table; histograms the
+        # user leaves out of hist_specs keep their default bins
+        self.param = dict(_DEFAULT_PARAM)
+        if ymax_animals is not None:
             self.param['ymax_anim'] = ymax_animals
-        else:
-            self.param['ymax_anim'] = None
-
-        if cmax_animals is not None:  # check is user have set parameter cmax_animals
-            # PAKK OPP DICT, OG HA CMAX_HERB OG CMAX_CARN KANSKJE?
+        if cmax_animals is not None:
             self.param['cmax_anim'] = cmax_animals
-        else:
-            self.param['cmax_anim'] = None
-
-        if hist_specs is not None:  # check for user histogram specifications
-
-
-            # self.param['age_lim_bins'] = np.arange(0, hist_specs['age']['max'],  # create array with bins limit
-            #                                        hist_specs['age']['delta'])
-            # self.param['wgt_lim_bins'] = np.arange(0, hist_specs['weight']['max'],
-            #                                        hist_specs['weight']['delta'])
-            # self.param['fit_lim_bins'] = np.arange(0, hist_specs['fitness']['max'],
-            #                                        hist_specs['fitness']['delta'])
-            for hist_key in hist_specs:
-                self.param[hist_key+"_lim_bins"] = np.arange(0, hist_specs[hist_key]['max'],  # create array with bins limit
-                                                   hist_specs[hist_key]['delta'])
-                self.param[hist_key+"_xlim"] = hist_specs[hist_key]['max']
-
-            # self.param['age_xlim'] = hist_specs['age']['max']  # limits for x-axis max
-            # self.param['wgt_xlim'] = hist_specs['weight']['max']
-            # self.param['fit_xlim'] = hist_specs['fitness']['max']
-        else:  # set default values as parameter values
-            self.param['age_lim_bins'] = np.arange(0, 1.0, 0.05)  # create array with bins limit
-            self.param['wgt_lim_bins'] = np.arange(0, 60.0, 2)
-            self.param['fit_lim_bins'] = np.arange(0, 60.0, 2)
-            self.param['age_xlim'] = 1.0   # limits for x-axis max
-            self.param['wgt_xlim'] = 60.0
-            self.param['fit_xlim'] = 60.0
+        for hist_key, spec in (hist_specs or {}).items():
+            alias = _HIST_ALIAS[hist_key]
+            self.param[alias + '_lim_bins'] = np.arange(0, spec['max'],  # create array with bins limit
+                                                        spec['delta'])
+            self.param[alias + '_xlim'] = spec['max']
+
+        # Bind bin edges, x-limits, bin count and value range per histogram
+        # once; setup and the per-frame updates read these attributes
+        # instead of repeating dict lookups
+        for alias in ('age', 'wgt', 'fit'):
+            bins = self.param[alias + '_lim_bins']
+            setattr(self, '_' + alias + '_bins', bins)
+            setattr(self, '_' + alias + '_xlim', self.param[alias + '_xlim'])
+            setattr(self, '_' + alias + '_nbins', len(bins) - 1)
+            setattr(self, '_' + alias + '_range', (0.0, float(bins[-1])))
 
         # set image or movie specifications, img_no to enumerate images saved.
         if img_base is not None:
@@ -153,6 +252,24 @@ class Graphics:
         self._img_no = 0  # image numbering if saving files
         self._img_years = 1  # interval between saving image to file
 
+        # stream raw frames into a persistent ffmpeg process instead of
+        # re-encoding the saved png files when the movie is created
+        self._stream_movie = stream_movie
+        self._ffmpeg_proc = None
+        self._stream_size = None  # frame size the stream was opened with
+        self._frames_streamed = 0
+
+        # GUI event-loop yields are only needed on interactive backends,
+        # and then at most every _gui_interval seconds of wall clock so
+        # fast simulations are not throttled by the event loop
+        self._interactive = matplotlib.get_backend().lower() != 'agg'
+        self._gui_interval = 0.05
+        self._last_gui_yield = 0.0
+
+        # blitting state: per-axes backgrounds of the static artists,
+        # captured after the first fully drawn frame
+        self._bg = None
+
         # the following will be initialized by _setup
         self._fig = None  # Figure setup
         self._grid_dim = None  # Subplot dimension
@@ -209,18 +326,59 @@ class Graphics:
         if self._fig is None:  # create new figure if none exist
             self._fig = plt.figure(figsize=(10, 8))
             self._fig.suptitle('Simulation of an island', weight='bold')
+            if self._interactive:
+                # map the window once; update() only flushes GUI events
+                # and would otherwise never get it on screen
+                plt.show(block=False)
 
         if self._grid_dim is None:  # create grid dimension for subplots
             self._grid_dim = (3, 4)
 
+        map_rows = str_map.split() if isinstance(str_map, str) else list(str_map)
+
         self._setup_year()  # 1st plot with year count
         self._setup_animal_count(final_year)  # 2nd plt with animal species count
-        self._setup_heatmap()  # 3rd and 4th plot of animal distribution
-        self._setup_map(str_map)  # 5th plot of island map
+        self._setup_heatmap((len(map_rows), len(map_rows[0])))  # 3rd and 4th plot of animal distribution
+        self._setup_map(map_rows)  # 5th plot of island map
         self._setup_histogram()  # 6-8th plot of three age, weight and fitness histogram
 
         plt.subplots_adjust(left=0.125, bottom=0.1, right=0.9, top=0.9, wspace=0.4, hspace=0.6)
 
+        # axis limits may have changed; cached backgrounds are stale
+        self._invalidate_blit()
+
+    def _animated_groups(self):
+        """
+        Group the per-frame mutable artists by the axes they live on.
+
+        Returns
+        -------
+        list of (Axes, list of Artist)
+            One entry per axes that changes between frames. Axes whose
+            artists are not created yet are left out.
+
+        """
+        groups = [(self._ax1_year, [self._year_txt]),
+                  (self._ax2_count, [self._count_herb, self._count_carn]),
+                  (self._ax4_herb_dist, [self._herb_dist_img]),
+                  (self._ax5_carn_dist, [self._carn_dist_img]),
+                  (self._ax6_anim_age, [self._age_herb, self._age_carn]),
+                  (self._ax7_anim_wgt, [self._wgt_herb, self._wgt_carn]),
+                  (self._ax8_anim_fit, [self._fit_herb, self._fit_carn])]
+        return [(ax, artists) for ax, artists in groups
+                if ax is not None and all(artist is not None for artist in artists)]
+
+    def _invalidate_blit(self):
+        """
+        Drop cached backgrounds and redraw everything on the next frame.
+
+        """
+        if self._bg is not None:
+            for _, artists in self._animated_groups():
+                for artist in artists:
+                    artist.set_animated(False)
+        self._bg = None
+
     def _setup_year(self):
         """
         Plot 1 axis with count of year simulated.
@@ -258,31 +416,31 @@ class Graphics:
 
         self._ax2_count.set_xlim(0, final_year + 1)  # to use simulate() x_lim needs subsequent updating
 
+        # the plotted slice covers exactly the simulated years; the backing
+        # arrays grow geometrically so repeated setups copy O(log n) times
+        self._plot_years = final_year + 1
+
         if self._count_herb is None:  # Herbivore line
-            herb_plot = self._ax2_count.plot(np.arange(0, final_year + 1),
-                                             np.full(final_year + 1, np.nan),
+            self._herb_y = np.full(self._plot_years, np.nan)
+            herb_plot = self._ax2_count.plot(np.arange(0, self._plot_years),
+                                             self._herb_y,
                                              color=line_color['Herbivore'])
             self._count_herb = herb_plot[0]
         else:
-            x_data, y_data = self._count_herb.get_data()
-            x_new = np.arange(x_data[-1] + 1, final_year + 1)
-            if len(x_new) > 0:
-                y_new = np.full(x_new.shape, np.nan)
-                self._count_herb.set_data(np.hstack((x_data, x_new)),
-                                          np.hstack((y_data, y_new)))
+            self._herb_y = self._grow_y_buffer(self._herb_y)
+            self._count_herb.set_data(np.arange(0, self._plot_years),
+                                      self._herb_y[:self._plot_years])
 
         if self._count_carn is None:  # Carnivore line
-            carn_plot = self._ax2_count.plot(np.arange(0, final_year + 1),
-                                             np.full(final_year + 1, np.nan),
+            self._carn_y = np.full(self._plot_years, np.nan)
+            carn_plot = self._ax2_count.plot(np.arange(0, self._plot_years),
+                                             self._carn_y,
                                              color=line_color['Carnivore'])
             self._count_carn = carn_plot[0]
         else:
-            x_data, y_data = self._count_carn.get_data()
-            x_new = np.arange(x_data[-1] + 1, final_year + 1)
-            if len(x_new) > 0:
-                y_new = np.full(x_new.shape, np.nan)
-                self._count_carn.set_data(np.hstack((x_data, x_new)),
-                                          np.hstack((y_data, y_new)))
+            self._carn_y = self._grow_y_buffer(self._carn_y)
+            self._count_carn.set_data(np.arange(0, self._plot_years),
+                                      self._carn_y[:self._plot_years])
 
         if self._count_lg is None:
             self._count_lg = plt.subplot2grid(self._grid_dim, (0, 3))
@@ -293,20 +451,64 @@ class Graphics:
                                                        facecolor=line_color[name]))
                 self._count_lg.text(0.35, ix * 0.2, name, transform=self._count_lg.transAxes)
 
-    def _setup_heatmap(self):
+    def _grow_y_buffer(self, buf):
+        """
+        Grow a count-line buffer to cover the plotted years.
+
+        Growth is geometric (at least doubling), so extending the
+        simulation repeatedly costs amortized constant time per year
+        instead of one full copy per setup call.
+
+        Parameters
+        ----------
+        buf : numpy.ndarray
+            The current backing buffer.
+
+        Returns
+        -------
+        numpy.ndarray
+            The same buffer, or a larger copy padded with NaN.
+
+        """
+        if self._plot_years <= buf.size:
+            return buf
+        grown = np.full(max(self._plot_years, 2 * buf.size), np.nan)
+        grown[:buf.size] = buf
+        return grown
+
+    def _setup_heatmap(self, map_shape):
         """
         Plot 3rd and 4th axis showing animal species distribution.
 
+        The image artists and their colorbars are created here, outside
+        the per-frame path, so :py:meth:`_update_heatmap` only has to
+        copy new counts into the existing buffers.
+
+        Parameters
+        ----------
+        map_shape : tuple of int
+            The (rows, columns) dimension of the island map.
+
         """
+        cmax = self.param['cmax_anim'] or {}  # default color-code limits per species
+
         if self._ax4_herb_dist is None:  # Herbivore
             self._ax4_herb_dist = plt.subplot2grid(self._grid_dim, (1, 0))
-            self._herb_dist_img = None
             self._ax4_herb_dist.set_title('Herbivore distr.')
+            self._herb_buf = np.zeros(map_shape, dtype=np.float32)  # reusable frame buffer
+            self._herb_dist_img = self._ax4_herb_dist.imshow(self._herb_buf,
+                                                             interpolation='nearest',
+                                                             vmin=0, vmax=cmax.get('Herbivore', 50))
+            plt.colorbar(self._herb_dist_img, ax=self._ax4_herb_dist)
 
         if self._ax5_carn_dist is None:  # Carnivore
             self._ax5_carn_dist = plt.subplot2grid(self._grid_dim, (1, 1))
-            self._carn_dist_img = None
             self._ax5_carn_dist.set_title('Carnivore distr.')
+            self._carn_buf = np.zeros(map_shape, dtype=np.float32)  # reusable frame buffer
+            self._carn_dist_img = self._ax5_carn_dist.imshow(self._carn_buf,
+                                                             interpolation='nearest',
+                                                             vmin=0, vmax=cmax.get('Carnivore', 20))
+            plt.colorbar(self._carn_dist_img, ax=self._ax5_carn_dist)
 
     def _setup_map(self, str_map):  # 5th plot of island map
         """
@@ -327,8 +529,20 @@ class Graphics:
                          'L': (0.0, 0.6, 0.0),  # dark green
                          'H': (0.5, 1.0, 0.5),  # light green
                          'D': (1.0, 1.0, 0.5)}  # light yellow
-            map_rgb = [[rgb_value[column] for column in row]
-                       for row in str_map]
+
+            # per-pixel colors via a 256-entry lookup table over the raw
+            # ascii bytes instead of a per-cell Python comprehension
+            if isinstance(str_map, str):
+                rows = str_map.split()
+            else:  # rows may be sequences of single characters
+                rows = [''.join(row) for row in str_map]
+            palette = np.array([rgb_value[land] for land in 'WLHD'], dtype=np.float32)
+            lut = np.zeros(256, dtype=np.uint8)
+            for i, land in enumerate('WLHD'):
+                lut[ord(land)] = i
+            idx = np.frombuffer(''.join(rows).encode('ascii'),
+                                dtype=np.uint8).reshape(len(rows), -1)
+            map_rgb = palette[lut[idx]]
 
             self._ax3_map.imshow(map_rgb)
             self._ax3_map.set_xticks(range(0, len(map_rgb[0]), 5))
@@ -353,53 +567,64 @@ class Graphics:
         # Plot for age of species histogram
         if self._ax6_anim_age is None:
             self._ax6_anim_age = plt.subplot2grid(self._grid_dim, (2, 0))
-            self._ax6_anim_age.set_xlim(0, self.param['age_xlim'])
+            self._ax6_anim_age.set_xlim(0, self._age_xlim)
             self._ax6_anim_age.set_ylim(0, 2000)
             self._ax6_anim_age.set_title('Age')
             self._ax6_anim_age.set_ylabel('Num of animals', weight='bold')
 
-            plot_age_herb = self._ax6_anim_age.step(self.param['age_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['age_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='olive')
+            # count buffers owned by Graphics; updates write into these
+            # in place instead of allocating new arrays per frame
+            self._age_herb_y = np.zeros(self._age_nbins)
+            self._age_carn_y = np.zeros(self._age_nbins)
+
+            plot_age_herb = self._ax6_anim_age.plot(self._age_bins[:-1],
+                                                    self._age_herb_y,
+                                                    drawstyle='steps-mid', color='olive')
             self._age_herb = plot_age_herb[0]
 
-            plot_age_carn = self._ax6_anim_age.step(self.param['age_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['age_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='darksalmon')
+            plot_age_carn = self._ax6_anim_age.plot(self._age_bins[:-1],
+                                                    self._age_carn_y,
+                                                    drawstyle='steps-mid', color='darksalmon')
             self._age_carn = plot_age_carn[0]
 
         # Plot for weight of species histogram
         if self._ax7_anim_wgt is None:
             self._ax7_anim_wgt = plt.subplot2grid(self._grid_dim, (2, 1))
-            self._ax7_anim_wgt.set_xlim(0, self.param['wgt_xlim'])
+            self._ax7_anim_wgt.set_xlim(0, self._wgt_xlim)
             self._ax7_anim_wgt.set_ylim(0, 2000)
             self._ax7_anim_wgt.set_title('Weight')
 
-            plot_wgt_herb = self._ax7_anim_wgt.step(self.param['wgt_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['wgt_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='olive')
+            self._wgt_herb_y = np.zeros(self._wgt_nbins)
+            self._wgt_carn_y = np.zeros(self._wgt_nbins)
+
+            plot_wgt_herb = self._ax7_anim_wgt.plot(self._wgt_bins[:-1],
+                                                    self._wgt_herb_y,
+                                                    drawstyle='steps-mid', color='olive')
             self._wgt_herb = plot_wgt_herb[0]
 
-            plot_wgt_carn = self._ax7_anim_wgt.step(self.param['wgt_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['wgt_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='darksalmon')
+            plot_wgt_carn = self._ax7_anim_wgt.plot(self._wgt_bins[:-1],
+                                                    self._wgt_carn_y,
+                                                    drawstyle='steps-mid', color='darksalmon')
             self._wgt_carn = plot_wgt_carn[0]
 
         # Plot for fitness of species histogram
         if self._ax8_anim_fit is None:
             self._ax8_anim_fit = plt.subplot2grid(self._grid_dim, (2, 2))
-            self._ax8_anim_fit.set_xlim(0, self.param['fit_xlim'])
+            self._ax8_anim_fit.set_xlim(0, self._fit_xlim)
             self._ax8_anim_fit.set_ylim(0, 2000)
             self._ax8_anim_fit.set_title('Fitness')
 
-            plot_fit_herb = self._ax8_anim_fit.step(self.param['fit_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['fit_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='olive')
+            self._fit_herb_y = np.zeros(self._fit_nbins)
+            self._fit_carn_y = np.zeros(self._fit_nbins)
+
+            plot_fit_herb = self._ax8_anim_fit.plot(self._fit_bins[:-1],
+                                                    self._fit_herb_y,
+                                                    drawstyle='steps-mid', color='olive')
             self._fit_herb = plot_fit_herb[0]
 
-            plot_fit_carn = self._ax8_anim_fit.step(self.param['fit_lim_bins'][:-1],
-                                                    np.zeros_like(self.param['fit_lim_bins'][:-1]),
-                                                    'b-', where='mid', color='darksalmon')
+            plot_fit_carn = self._ax8_anim_fit.plot(self._fit_bins[:-1],
+                                                    self._fit_carn_y,
+                                                    drawstyle='steps-mid', color='darksalmon')
             self._fit_carn = plot_fit_carn[0]
 
         line_color = {'Herbivore': 'olive', 'Carnivore': 'darksalmon'}  # legend
@@ -442,8 +667,30 @@ class Graphics:
         self._update_mean_graph(step, anim_pop)
         self._update_heatmap(anim_matrix)
         self._update_histogram(data_hist)
-        self._fig.canvas.flush_events()  # ensure every thing is drawn
-        plt.pause(1e-6)  # pause required to pass control to GUI
+
+        canvas = self._fig.canvas
+        if self._bg is None:
+            # first frame after (re)setup: mark the per-frame artists as
+            # animated so the full draw renders only the static parts,
+            # then cache those as the per-axes blit backgrounds
+            groups = self._animated_groups()
+            for _, artists in groups:
+                for artist in artists:
+                    artist.set_animated(True)
+            canvas.draw()
+            self._bg = {ax: canvas.copy_from_bbox(ax.bbox) for ax, _ in groups}
+        # blit: restore the static background and redraw only the
+        # artists that changed, leaving map and legends untouched
+        for ax, artists in self._animated_groups():
+            canvas.restore_region(self._bg[ax])
+            for artist in artists:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+        if self._interactive:  # no GUI to pass control to under Agg
+            now = time.monotonic()
+            if now - self._last_gui_yield >= self._gui_interval:
+                canvas.flush_events()  # pass control to the GUI event loop
+                self._last_gui_yield = now
 
         self._save_graphics(step)
 
@@ -457,7 +704,9 @@ class Graphics:
             Same as year of current simulation
 
         """
-        self._year_txt.set_text(self._year_tmpl.format(step))
+        txt = f"Year: {step:5d}"
+        if txt != self._year_txt.get_text():  # skip the artist re-layout
+            self._year_txt.set_text(txt)
 
     def _update_mean_graph(self, step, population):
         """
@@ -478,21 +727,12 @@ class Graphics:
 
         """
         # herbivore line
-
-        # OPPDATERE YMAX
-        # if self.ymax and self.ymax < self.num_animals:
-        #     self._line_graph_ax.set_ylim(0, self.ymax)
-        # else:
-        #     self._line_graph_ax.set_ylim(0, self.num_animals * 1.3)
-
-        y_data_herb = self._count_herb.get_ydata()
-        y_data_herb[step] = population[0]
-        self._count_herb.set_ydata(y_data_herb)
+        self._herb_y[step] = population[0]
+        self._count_herb.set_ydata(self._herb_y[:self._plot_years])
 
         # carnivore line
-        y_data_carn = self._count_carn.get_ydata()
-        y_data_carn[step] = population[1]
-        self._count_carn.set_ydata(y_data_carn)
+        self._carn_y[step] = population[1]
+        self._count_carn.set_ydata(self._carn_y[:self._plot_years])
 
     def _update_heatmap(self, anim_matrix):
         """
@@ -506,21 +746,12 @@ class Graphics:
             for Carnivore.
 
         """
-        if self._herb_dist_img is not None:  # heatmap for herbivores
-            self._herb_dist_img.set_data(anim_matrix[0])
-        else:
-            self._herb_dist_img = self._ax4_herb_dist.imshow(anim_matrix[0],
-                                                             interpolation='nearest',
-                                                             vmin=-0, vmax=self.param["cmax_anim"]["Herbivore"])
-            plt.colorbar(self._herb_dist_img, ax=self._ax4_herb_dist)
+        # branchless: the image artists and buffers exist since setup
+        np.copyto(self._herb_buf, anim_matrix[0], casting='unsafe')
+        self._herb_dist_img.set_data(self._herb_buf)
 
-        if self._carn_dist_img is not None:  # heatmap for carnivores
-            self._carn_dist_img.set_data(anim_matrix[1])
-        else:
-            self._carn_dist_img = self._ax5_carn_dist.imshow(anim_matrix[1],
-                                                             interpolation='nearest',
-                                                             vmin=-0, vmax=self.param["cmax_anim"]["Carnivore"])
-            plt.colorbar(self._carn_dist_img, ax=self._ax5_carn_dist)
+        np.copyto(self._carn_buf, anim_matrix[1], casting='unsafe')
+        self._carn_dist_img.set_data(self._carn_buf)
 
     def _update_histogram(self, hist_data):
         """
@@ -539,23 +770,32 @@ class Graphics:
                 - data_hist[2][1], list of animal age values for Carnivore
 
         """
-        # update of age histograms
-        herb_age_data, bins = np.histogram(hist_data[2][0], self.param['age_lim_bins'])
-        self._age_herb.set_ydata(herb_age_data)
-        carn_age_data, bins = np.histogram(hist_data[2][1], self.param['age_lim_bins'])
-        self._age_carn.set_ydata(carn_age_data)
-
-        # update of age histograms
-        herb_wgt_data, bins = np.histogram(hist_data[1][0], self.param['wgt_lim_bins'])
-        self._wgt_herb.set_ydata(herb_wgt_data)
-        carn_wgt_data, bins = np.histogram(hist_data[1][1], self.param['wgt_lim_bins'])
-        self._wgt_carn.set_ydata(carn_wgt_data)
+        # one list-to-array conversion per data series, shared by the
+        # histogram calls below instead of six implicit coercions
+        fit_herb = np.asarray(hist_data[0][0], dtype=np.float64)
+        fit_carn = np.asarray(hist_data[0][1], dtype=np.float64)
+        wgt_herb = np.asarray(hist_data[1][0], dtype=np.float64)
+        wgt_carn = np.asarray(hist_data[1][1], dtype=np.float64)
+        age_herb = np.asarray(hist_data[2][0], dtype=np.float64)
+        age_carn = np.asarray(hist_data[2][1], dtype=np.float64)
 
         # update of age histograms
-        herb_fit_data, bins = np.histogram(hist_data[0][0], self.param['fit_lim_bins'])
-        self._fit_herb.set_ydata(herb_fit_data)
-        carn_fit_data, bins = np.histogram(hist_data[0][1], self.param['fit_lim_bins'])
-        self._fit_carn.set_ydata(carn_fit_data)
+        np.copyto(self._age_herb_y, _hist_counts(age_herb, self._age_nbins, self._age_range))
+        self._age_herb.set_ydata(self._age_herb_y)
+        np.copyto(self._age_carn_y, _hist_counts(age_carn, self._age_nbins, self._age_range))
+        self._age_carn.set_ydata(self._age_carn_y)
+
+        # update of weight histograms
+        np.copyto(self._wgt_herb_y, _hist_counts(wgt_herb, self._wgt_nbins, self._wgt_range))
+        self._wgt_herb.set_ydata(self._wgt_herb_y)
+        np.copyto(self._wgt_carn_y, _hist_counts(wgt_carn, self._wgt_nbins, self._wgt_range))
+        self._wgt_carn.set_ydata(self._wgt_carn_y)
+
+        # update of fitness histograms
+        np.copyto(self._fit_herb_y, _hist_counts(fit_herb, self._fit_nbins, self._fit_range))
+        self._fit_herb.set_ydata(self._fit_herb_y)
+        np.copyto(self._fit_carn_y, _hist_counts(fit_carn, self._fit_nbins, self._fit_range))
+        self._fit_carn.set_ydata(self._fit_carn_y)
 
     def _save_graphics(self, step):
         """
@@ -571,11 +811,65 @@ class Graphics:
         if self._img_base is None or step % self._img_years != 0:
             return
 
+        # animated artists are skipped by full draws; include them while saving
+        animated = [artist for _, artists in self._animated_groups() for artist in artists
+                    if artist.get_animated()]
+        for artist in animated:
+            artist.set_animated(False)
         plt.savefig('{base}_{num:05d}.{type}'.format(base=self._img_base,
                                                      num=self._img_no,
                                                      type=self._img_fmt))
+        if self._stream_movie:
+            # the stream draw must also see the animated artists, so it
+            # happens before the flags are restored
+            self._stream_frame()
+        for artist in animated:
+            artist.set_animated(True)
         self._img_no += 1
 
+    def _stream_frame(self):
+        """
+        Pipe the current canvas as one raw RGBA frame to ffmpeg.
+
+        The ffmpeg process is spawned lazily on the first frame and kept
+        alive for the rest of the life of this Graphics object, across
+        any later :py:meth:`setup` reconfigurations; raw frames avoid
+        the png encode, decode and re-encode round trip of the
+        image-scan movie path. If ffmpeg cannot be started, streaming
+        is disabled and :py:meth:`make_movie` falls back to scanning
+        the saved images. A raw stream has a fixed frame size, so
+        frames drawn at any other size are skipped.
+
+        """
+        self._fig.canvas.draw()
+        width, height = self._fig.canvas.get_width_height()
+        if self._ffmpeg_proc is None:
+            try:
+                self._ffmpeg_proc = subprocess.Popen(
+                    [_FFMPEG_BINARY, '-y',
+                     '-f', 'rawvideo',
+                     '-pix_fmt', 'rgba',
+                     '-s', '{}x{}'.format(width, height),
+                     '-r', '25',
+                     '-i', '-',
+                     '-pix_fmt', 'yuv420p']
+                    + _h264_encoder_args()
+                    + ['{}.mp4'.format(self._img_base)],
+                    stdin=subprocess.PIPE, bufsize=1 << 20)
+            except OSError:
+                self._stream_movie = False  # ffmpeg unavailable; use the png path
+                return
+            self._stream_size = (width, height)
+            if fcntl is not None:
+                try:  # grow the kernel pipe so whole frames fit in one write
+                    fcntl.fcntl(self._ffmpeg_proc.stdin.fileno(), F_SETPIPE_SZ, 1 << 20)
+                except OSError:
+                    pass  # pipe size is capped by the system; keep the default
+        if (width, height) != self._stream_size:
+            return
+        self._ffmpeg_proc.stdin.write(self._fig.canvas.buffer_rgba())
+        self._frames_streamed += 1
+
     def make_movie(self, movie_fmt):
         """
         Creates MPEG4 movie from visualization images saved.
@@ -595,16 +889,23 @@ class Graphics:
             raise RuntimeError("No filename defined.")
 
         if movie_fmt == 'mp4':
+            if self._ffmpeg_proc is not None:  # finalize the streamed movie
+                self._ffmpeg_proc.stdin.close()
+                self._ffmpeg_proc.wait()
+                self._ffmpeg_proc = None
+                return
             try:
                 # Parameters chosen according to http://trac.ffmpeg.org/wiki/Encode/H.264,
-                # section "Compatibility"
+                # section "Compatibility"; a hardware encoder is picked
+                # when ffmpeg offers one
                 subprocess.check_call([_FFMPEG_BINARY,
                                        '-i', '{}_%05d.png'.format(self._img_base),
                                        '-y',
                                        '-profile:v', 'baseline',
                                        '-level', '3.0',
-                                       '-pix_fmt', 'yuv420p',
-                                       '{}.{}'.format(self._img_base, movie_fmt)])
+                                       '-pix_fmt', 'yuv420p']
+                                      + _h264_encoder_args()
+                                      + ['{}.{}'.format(self._img_base, movie_fmt)])
             except subprocess.CalledProcessError as err:
                 raise RuntimeError('ERROR: ffmpeg failed with: {}'.format(err))
         elif movie_fmt == 'gif':
@@ -37,9 +37,10 @@ class Island:
 
     Attributes
     ----------
-    island_map : dict
-        dict where an index for location is key and the landscape type is the object.
-        Note that the index will start at [0,0], and is therefore not the same as the `loc`
+    island_map : numpy.ndarray
+        2D object array where the index is the location and the landscape
+        object the value. Note that the index will start at [0,0], and is
+        therefore not the same as the `loc`
     map_size : tuple
         Gives the dimensions of the map
 
@@ -59,7 +60,8 @@ class Island:
     }
 
     def __init__(self, ini_pop=None, geogr=''):
-        self.island_map = {}  # empty dict for storing the map
+        self.island_map = None  # object grid of landscape cells, built by init_map
+        self._migration_epoch = 0  # bumped each year; stamps animals that moved
         self.map_size = self.init_map(geogr)  # initializing map and storing the size of the map
         self.add_island_pop(ini_pop)
 
@@ -87,32 +89,34 @@ class Island:
             anim_pop = _dict['pop']
             self.island_map[i - 1, j - 1].add_land_pop(anim_pop)    # Adding animals to given location
 
-    def map_check(self, i, j, char, num_row, num_col):
+    def map_check(self, cell_matrix):
         """
         Checking that the island is surrounded by water and that the island only contains defined landscape types
 
+        The whole matrix is validated with four border slice comparisons
+        and one membership test instead of one check per cell.
+
         Parameters
         ----------
-        i : int
-            Row index
-        j : int
-            Column index
-        char: str
-            Landscape type
-        num_row: int
-            Number of rows in the map
-        num_col: int
-            Number of columns in the map
+        cell_matrix : numpy.ndarray
+            2D array of single-byte landscape characters
 
         Raises
         -------
         ValueError
 
         """
-        if i == 0 and char != 'W' or i == num_row and char != 'W' or \
-                j == 0 and char != 'W' or j == num_col and char != 'W':
+        border_water = ((cell_matrix[0] == b'W').all()
+                        and (cell_matrix[-1] == b'W').all()
+                        and (cell_matrix[:, 0] == b'W').all()
+                        and (cell_matrix[:, -1] == b'W').all())
+        if not border_water:
             raise ValueError('The island must be surrounded by water')
-        if char not in self.landscape_mapping.keys():
+
+        known = np.array(sorted(self.landscape_mapping), dtype='S1')
+        defined = np.isin(cell_matrix, known)
+        if not defined.all():
+            char = cell_matrix[~defined][0].decode('ascii')
             raise ValueError(
                 'The given landscape "{char}" is not defined. Defined landscapes are {landscapes}'.format(
                     char=char, landscapes=self.landscape_mapping.keys()))
@@ -122,7 +126,8 @@ class Island:
         Initializing the map.
 
         Checks that the map size is ok -> That the number of columns is constant.
-        Making a dictionary of the map, with keys (index) and value the landscape object
+        Making a 2D object array of the map, indexed by cell position with the
+        landscape object as value
 
         Parameters
         ----------
@@ -134,24 +139,42 @@ class Island:
         map_size : tuple
             The size of the map
         """
-        cell_matrix = np.array([[char for char in row] for row in geostr.split()])
-        map_size = np.shape(cell_matrix)
-
-        # Test that the map size is ok
-        try:
-            num_row = map_size[0] - 1
-            num_col = map_size[1] - 1
-        except IndexError:
+        # Test that the map size is ok, then parse the characters at the
+        # byte level instead of building a Python list per cell
+        rows = geostr.split()
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
             raise ValueError('All the rows of the island must be of the same length')
-
-        for i, row in enumerate(cell_matrix):
+        cell_matrix = np.frombuffer(''.join(rows).encode('ascii'),
+                                    dtype='S1').reshape(len(rows), -1)
+        map_size = cell_matrix.shape
+        self.map_check(cell_matrix)
+
+        # object grid instead of a tuple-keyed dict: cell access is plain
+        # array indexing and iteration is a flat, row-major pass
+        self.island_map = np.empty(map_size, dtype=object)
+        for i, row in enumerate(rows):
             for j, char in enumerate(row):
-                self.map_check(i, j, char, num_row, num_col)
-
-                # Adding to dict -> key is index and value is the given landscape type
-                # (This is NOT the loc, but index for the island-dict. The index will start at [0,0])
+                # Adding to grid -> index is position and value is the given landscape type
+                # (This is NOT the loc; the index will start at [0,0])
                 self.island_map[i, j] = self.landscape_mapping[char]()
 
+        # Land cells (with their index) collected once: water is typically
+        # most of the map and can never hold animals, so the yearly loops
+        # only visit cells that can.
+        self.land_cell_items = [(index, cell)
+                                for index, cell in np.ndenumerate(self.island_map)
+                                if cell.accessible]
+        self.land_cells = [cell for _, cell in self.land_cell_items]
+
+        # Neighbour table built once; migration reads it every year instead
+        # of doing four dict lookups per cell. The border is all water, so
+        # only interior cells can hold animals and need neighbours.
+        self.neighbours = {
+            (i, j): (self.island_map[i - 1, j], self.island_map[i, j - 1],
+                     self.island_map[i, j + 1], self.island_map[i + 1, j])
+            for i in range(1, map_size[0] - 1)
+            for j in range(1, map_size[1] - 1)}
+
         return map_size
 
     @staticmethod
@@ -177,73 +200,22 @@ class Island:
         """
         Migrate animals to nearby cells.
 
-        Creates an index for nearby cells, then checks if animals want
-        to migrate cell by cell. If they move animals are added to
-        population list in new location.
-
-        """
-        def _nearby_cells(_index):
-            """
-            Finding the neighbouring cells. (Not diagonally)
-
-            Parameters
-            ----------
-            _index : tuple
-                the key in self.island_map dict
-
-            Returns
-            -------
-            nearby_cells : object
-                The landscape-objects of the nearby cells
-            """
-            row = _index[0]
-            col = _index[1]
-            # Making a list of the neighbouring landscape-object
-            nearby_cells = [self.island_map[row - 1, col], self.island_map[row, col - 1],
-                            self.island_map[row, col + 1], self.island_map[row + 1, col]]
-            return nearby_cells
-
-        # for index, cell in self.island_map.items():
-        #     if self.anim_in_cell(cell):
-        #         cell.migration(_nearby_cells(index))
-
-        def _migrate_anim(index, cell):
-            # cell.herb_pop = [
-            #     anim for anim in cell.herb_pop
-            #     if not _move_single_anim(index, anim)
-            # ]
-            # cell.carn_pop = [
-            #     anim for anim in cell.carn_pop
-            #     if not _move_single_anim(index, anim)
-            # ]
-            for key in cell.pop.keys():
-                pop[key] = [anim for anim in pop[key] if not _move_single_anim(index, anim, key)]
-
-        def _move_single_anim(index, anim, key):
-            if anim.migrated is False and anim.migrate():
-                chosen = random.choice(_nearby_cells(index))
-                if chosen.accessible:
-                    # if type(anim).__name__ is "Herbivore":
-                    #     chosen.herb_pop.append(anim)
-                    #     anim.migrated = True
-                    # else:
-                    #     chosen.carn_pop.append(anim)
-                    #     anim.migrated = True
-                    chosen[key].append(anim)
-                    anim.migrated = True
-                    return True 
-
-        for index, cell in self.map.items():
-            if self.anim_in_cell(cell):
-                _migrate_anim(index, cell)
-
-
-
-
-
-
+        Each populated cell migrates its animals to the neighbouring
+        cells from the table built in :py:meth:`init_map`. Every year
+        gets a fresh migration epoch; animals that move are stamped
+        with it, so each animal moves at most once per year and no
+        end-of-year reset pass over the populations is needed.
 
+        See Also
+        --------
+        biosim.landscape.Landscape.migration
+            The per-cell migration step.
 
+        """
+        self._migration_epoch += 1
+        for index, cell in self.land_cell_items:
+            if cell.herb_pop or cell.carn_pop:
+                cell.migration(self.neighbours[index], self._migration_epoch)
 
     def annual_cycle(self):
         """
@@ -258,27 +230,35 @@ class Island:
             1. Feeding
             2. Procreation
             3. Migration
-            4. Aging
-            5. Annual loss of weight
-            6. Annual death of animals
+            4. Aging and annual loss of weight, fused per cell
+            5. Annual death of animals
 
         See Also
         --------
         landscape.feeding
         landscape.procreation
         annual_migration
-        landscape.aging
-        landscape.loss_of_weight
+        landscape.annual_tick
         landscape.death
 
         """
 
-        [cell.feeding() for cell in self.island_map.values() if self.anim_in_cell(cell)]
-        [cell.procreation() for cell in self.island_map.values() if self.anim_in_cell(cell)]
+        # evaluate the active-cell predicate once per phase group; the
+        # populated set only changes at migration, so one list serves
+        # feeding and procreation and one the post-migration steps
+        active = [cell for cell in self.land_cells
+                  if cell.herb_pop or cell.carn_pop]
+        for cell in active:
+            cell.feeding()
+        for cell in active:
+            cell.procreation()
         self.annual_migration()
-        [cell.aging() for cell in self.island_map.values() if self.anim_in_cell(cell)]
-        [cell.loss_of_weight() for cell in self.island_map.values() if self.anim_in_cell(cell)]
-        [cell.death() for cell in self.island_map.values() if self.anim_in_cell(cell)]
+        active = [cell for cell in self.land_cells
+                  if cell.herb_pop or cell.carn_pop]
+        for cell in active:
+            cell.annual_tick()
+        for cell in active:
+            cell.death()
 
     def anim_count(self):
         """
@@ -290,13 +270,8 @@ class Island:
             (num_herb, num_carn)
         """
 
-        num_herb = 0
-        num_carn = 0
-
-        for cell in self.island_map.values():
-            if self.anim_in_cell(cell):
-                num_herb += cell.pop_count_herb()
-                num_carn += cell.pop_count_carn()
+        num_herb = sum(len(cell.herb_pop) for cell in self.land_cells)
+        num_carn = sum(len(cell.carn_pop) for cell in self.land_cells)
 
         return num_herb, num_carn
 
@@ -314,10 +289,9 @@ class Island:
         count_herb_matrix = np.zeros(self.map_size, dtype=int)
         count_carn_matrix = np.zeros(self.map_size, dtype=int)
 
-        for index, cell in self.island_map.items():
-            if self.anim_in_cell(cell):
-                count_herb_matrix[index] = cell.pop_count_herb()
-                count_carn_matrix[index] = cell.pop_count_carn()
+        for index, cell in self.land_cell_items:
+            count_herb_matrix[index] = cell.pop_count_herb()
+            count_carn_matrix[index] = cell.pop_count_carn()
 
         return count_herb_matrix, count_carn_matrix
 
@@ -343,7 +317,7 @@ class Island:
         herb_weight, carn_weight = [], []
         herb_age, carn_age = [], []
 
-        for cell in self.island_map.values():
+        for cell in self.land_cells:
             for herb in cell.herb_pop:
                 herb_fit.append(herb.fitness)
                 herb_weight.append(herb.weight)
@@ -354,3 +328,44 @@ class Island:
                 carn_age.append(carn.age)
 
         return [[herb_fit, carn_fit], [herb_weight, carn_weight], [herb_age, carn_age]]
+
+    def snapshot(self):
+        """
+        Collect all per-year visualization data in one pass.
+
+        Walks the populated land cells once and produces what
+        :py:meth:`anim_count`, :py:meth:`anim_matrix` and
+        :py:meth:`hist_data` would return from three separate passes.
+
+        Returns
+        -------
+        tuple
+            ``(counts, matrices, data_hist)`` where ``counts`` is the
+            (num_herb, num_carn) tuple, ``matrices`` the distribution
+            matrix pair and ``data_hist`` the nested fitness, weight
+            and age lists per species.
+
+        """
+        count_herb_matrix = np.zeros(self.map_size, dtype=int)
+        count_carn_matrix = np.zeros(self.map_size, dtype=int)
+
+        herb_fit, carn_fit = [], []
+        herb_weight, carn_weight = [], []
+        herb_age, carn_age = [], []
+
+        for index, cell in self.land_cell_items:
+            count_herb_matrix[index] = len(cell.herb_pop)
+            count_carn_matrix[index] = len(cell.carn_pop)
+            for herb in cell.herb_pop:
+                herb_fit.append(herb.fitness)
+                herb_weight.append(herb.weight)
+                herb_age.append(herb.age)
+            for carn in cell.carn_pop:
+                carn_fit.append(carn.fitness)
+                carn_weight.append(carn.weight)
+                carn_age.append(carn.age)
+
+        return ((len(herb_fit), len(carn_fit)),
+                (count_herb_matrix, count_carn_matrix),
+                [[herb_fit, carn_fit], [herb_weight, carn_weight],
+                 [herb_age, carn_age]])
@@ -75,9 +75,16 @@ Land accessible? For highland == True, while water == False
 __author__ = 'Therese Aase Knapskog and Astrid Moum'
 __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 
-from .animals import Herbivore, Carnivore
+from .animals import Herbivore, Carnivore, update_fitness_all, annual_tick_pop, filter_survivors
+import numpy as np
 import random
-import operator
+from itertools import chain
+
+# module-local binds for the per-cell hot loops; skips the module
+# attribute lookup on every call
+_shuffle = random.shuffle
+_np_random = np.random.random
+_np_randint = np.random.randint
 
 
 class Landscape:
@@ -118,6 +125,10 @@ class Landscape:
 
     """
 
+    # populations live in slots: no per-cell instance dict, which matters
+    # when the island allocates one landscape object per map cell
+    __slots__ = ('herb_pop', 'carn_pop')
+
     param = None  #: (`dict`) - class variable with parameters used in methods
     accessible = True  #: bool : `True` if landscape can inhabit animal populations.
 
@@ -235,14 +246,43 @@ class Landscape:
 
         fodder = self.param['f_max']  # Growth of fodder to landscape maximum fodder level
 
-        random.shuffle(self.herb_pop)  # Population is shuffled to a random order
-        for herb in self.herb_pop:
-            fodder -= herb.eat_fodder(fodder)  # Herbivore eats of available fodder
+        if fodder:  # barren cells (Desert) skip the grazing pass entirely
+            _shuffle(self.herb_pop)  # Population is shuffled to a random order
+            for herb in self.herb_pop:
+                fodder -= herb.eat_fodder(fodder)  # Herbivore eats of available fodder
 
-        self.herb_pop.sort(key=operator.attrgetter('fitness'))  # Herb sorted from low to high fitness
-        self.carn_pop.sort(key=operator.attrgetter('fitness'), reverse=True)  # Carn sorted from high to low fitness
+        self._hunt()
+
+    def _hunt(self):
+        """
+        Predation phase of feeding: carnivores hunt the herbivores.
+
+        Carnivores hunt in order of decreasing fitness, each one facing
+        the surviving herbivores sorted from low to high fitness. The
+        per-carnivore hunt itself is evaluated columnar in
+        :py:meth:`biosim.animals.Carnivore.eat_herb`; this loop only
+        threads the shrinking prey list between hunters and stops as
+        soon as no prey is left.
+
+        """
+        # rank by fitness through one gathered key array per species
+        # instead of an attrgetter call per element during the sort
+        herb_fit = np.fromiter((anim.fitness for anim in self.herb_pop),
+                               dtype=np.float64, count=len(self.herb_pop))
+        carn_fit = np.fromiter((anim.fitness for anim in self.carn_pop),
+                               dtype=np.float64, count=len(self.carn_pop))
+        # Herb sorted from low to high fitness, carn from high to low;
+        # stable order keeps ties in list order, like list.sort did
+        self.herb_pop = [self.herb_pop[k]
+                         for k in np.argsort(herb_fit, kind='stable')]
+        self.carn_pop = [self.carn_pop[k]
+                         for k in np.argsort(-carn_fit, kind='stable')]
+        herb_pop = self.herb_pop
         for carn in self.carn_pop:  # Carnivore tries to kill and eat Herbivore
-            self.herb_pop = carn.eat_herb(self.herb_pop)  # Returning all Herbivores that survived
+            if not herb_pop:
+                break
+            herb_pop = carn.eat_herb(herb_pop)  # Returning all Herbivores that survived
+        self.herb_pop = herb_pop
 
     def procreation(self):
         """
@@ -270,12 +310,17 @@ class Landscape:
 
             """
             num_animals = len(anim_pop)  # calculate number of animals of same species in population
-            return [nb for nb in [parent.birth(num_animals) for parent in anim_pop] if nb is not None]
+            if num_animals < 2:  # a lone animal can never give birth
+                return []
+            rolls = _np_random(num_animals)  # all birth rolls in one batch
+            return [nb for nb in (parent.birth(num_animals, roll)
+                                  for parent, roll in zip(anim_pop, rolls))
+                    if nb is not None]
 
         self.herb_pop.extend(_newborns(self.herb_pop))  # add Herbivore newborn to list of Herbivore population
         self.carn_pop.extend(_newborns(self.carn_pop))  # add Carnivore newborn to list of Carnivore population
 
-    def migration(self, nearby_cells):  # not applicable before migration
+    def migration(self, nearby_cells, epoch):  # not applicable before migration
         """
         Migrate to nearby landscapes/cells.
 
@@ -290,17 +335,21 @@ class Landscape:
 
         2. Animals randomly chose which cell they want to move to from the nearby cells
         3. If the chosen cell is not water, the animal moves
-        4. The migrated animal is flagged so that one animal can move only once per year
-        5. After all migrations, the flag is reset so that all animals can migrate the upcoming year
+        4. The migrated animal is stamped with the year's migration epoch so
+           that one animal can move only once per year. Stale stamps need no
+           reset; the island simply uses a fresh epoch every year
         The method will update the nearby cells that animals migrate to.
         The current cell will be updated to remove the migrated animals
 
         Parameters
         ----------
         nearby_cells : list
-                    List of objects of the class Landscape. The list is of the possible cells that 
+                    List of objects of the class Landscape. The list is of the possible cells that
                     the animals in the current cell can move to. This means the neighbouring cells,
                     but not cells diagonally displaced
+        epoch : int
+                    The island's migration epoch for this year; animals whose
+                    stamp equals it have already moved
 
         See Also
         --------
@@ -324,32 +373,47 @@ class Landscape:
                 Animals in animal population that wants to move.
 
             """
-            return [anim for anim in anim_pop if anim.migrate()]
+            rolls = _np_random(len(anim_pop))  # all migration rolls in one batch
+            return [anim for anim, roll in zip(anim_pop, rolls) if anim.migrate(roll)]
 
         herb_mig, carn_mig = _migrators(self.herb_pop), _migrators(self.carn_pop)
-        migrated_herb = []
-        migrated_carn = []
-        for herb in herb_mig:
-            chosen = random.choice(nearby_cells)
-            if chosen.accessible is True and herb.migrated is False:
+        migrated_ids = set()  # id() set makes the removal below a hash lookup
+        # one batched draw of destination directions for all migrators
+        directions = _np_randint(0, 4, len(herb_mig) + len(carn_mig))
+        for herb, direction in zip(herb_mig, directions):
+            chosen = nearby_cells[direction]
+            if chosen.accessible is True and herb.migrated != epoch:
                 chosen.herb_pop.append(herb)
-                migrated_herb.append(herb)
-                herb.migrated = True
+                migrated_ids.add(id(herb))
+                herb.migrated = epoch
 
-        for carn in carn_mig:
-            chosen = random.choice(nearby_cells)
-            if chosen.accessible is True and carn.migrated is False:
+        for carn, direction in zip(carn_mig, directions[len(herb_mig):]):
+            chosen = nearby_cells[direction]
+            if chosen.accessible is True and carn.migrated != epoch:
                 chosen.carn_pop.append(carn)
-                migrated_carn.append(carn)
-                carn.migrated = True
+                migrated_ids.add(id(carn))
+                carn.migrated = epoch
 
-        self.herb_pop = [anim for anim in self.herb_pop if anim not in migrated_herb]
-        self.carn_pop = [anim for anim in self.carn_pop if anim not in migrated_carn]
+        if migrated_ids:
+            self.herb_pop = [anim for anim in self.herb_pop if id(anim) not in migrated_ids]
+            self.carn_pop = [anim for anim in self.carn_pop if id(anim) not in migrated_ids]
 
-        for anim in self.herb_pop + self.carn_pop:
-            anim.migrated = False
 
+    def annual_tick(self):
+        """
+        Fused annual aging and loss of weight for all animals in landscape.
 
+        Equivalent to calling `aging` followed by `loss_of_weight`, but
+        each animal is visited once and fitness is recomputed in one
+        batch per species.
+
+        See Also
+        --------
+        biosim.animals.Animal.annual_tick
+            The fused per-animal aging and weight-loss update.
+        """
+        annual_tick_pop(self.herb_pop)
+        annual_tick_pop(self.carn_pop)
 
     def aging(self):
         """
@@ -360,7 +424,9 @@ class Landscape:
         biosim.animals.age_change()
             The animal gets one year older
         """
-        [anim.age_change() for anim in self.herb_pop + self.carn_pop]
+        [anim.age_change(update_fitness=False) for anim in chain(self.herb_pop, self.carn_pop)]
+        update_fitness_all(self.herb_pop)
+        update_fitness_all(self.carn_pop)
 
     def loss_of_weight(self):
         """
@@ -370,7 +436,9 @@ class Landscape:
         --------
         biosim.animals.weight_loss()
         """
-        [anim.weight_loss() for anim in self.herb_pop + self.carn_pop]
+        [anim.weight_loss(update_fitness=False) for anim in chain(self.herb_pop, self.carn_pop)]
+        update_fitness_all(self.herb_pop)
+        update_fitness_all(self.carn_pop)
 
     def death(self):
         """
@@ -385,8 +453,9 @@ class Landscape:
 
         """
 
-        self.herb_pop = [herb for herb in self.herb_pop if not herb.dying()]
-        self.carn_pop = [carn for carn in self.carn_pop if not carn.dying()]
+        # the death predicate is evaluated columnar for the whole population
+        self.herb_pop = filter_survivors(self.herb_pop)
+        self.carn_pop = filter_survivors(self.carn_pop)
 
 
 class Lowland(Landscape):
@@ -405,6 +474,8 @@ class Lowland(Landscape):
 
 
     """
+    __slots__ = ()
+
     param = dict(f_max=800)  #: dict of str : Desert param to parameterize methods
 
 
@@ -424,6 +495,8 @@ class Highland(Landscape):
 
 
     """
+    __slots__ = ()
+
     param = dict(f_max=300)  #: dict of str : Desert param to parameterize methods
 
 
@@ -442,6 +515,7 @@ class Desert(Landscape):
     --------
 
     """
+    __slots__ = ()
 
     param = dict(f_max=0)  #: dict of str : Desert param to parameterize methods
 
@@ -461,5 +535,6 @@ class Water(Landscape):
     --------
 
     """
+    __slots__ = ()
 
     accessible = False  #: bool : `False` if landscape cannot inhabit animal populations.
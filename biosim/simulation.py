@@ -34,12 +34,46 @@ With this code:
 __author__ = 'Therese Aase Knapskog and Astrid Moum'
 __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 
+import random
+from concurrent import futures
+
 import numpy as np
 from .island import Island
-from .graphics import Graphics
 from .animals import Herbivore, Carnivore
 
 
+def _run_single(cfg, num_years):
+    """Build one simulation from ``cfg``, run it and report the counts.
+
+    Module-level so :class:`~concurrent.futures.ProcessPoolExecutor`
+    can pickle it for the worker processes of :meth:`BioSim.run_ensemble`.
+    """
+    cfg = dict(cfg)
+    cfg.setdefault('visualize', False)
+    sim = BioSim(**cfg)
+    sim.simulate(num_years)
+    return sim.num_animals_per_species
+
+
+class _NullGraphics:
+    """Stand-in for :class:`Graphics` when visualization is disabled.
+
+    Accepts the same calls as the real thing and does nothing, so
+    :meth:`BioSim.simulate` needs no branching. Constructing it keeps
+    matplotlib entirely unimported, which matters when many short-lived
+    simulations run in one sweep.
+    """
+
+    def setup(self, final_step, img_step, str_map):
+        pass
+
+    def update(self, step, counts, matrices, data_hist):
+        pass
+
+    def make_movie(self, movie_fmt=None):
+        pass
+
+
 class BioSim:
     """
     Provides user interface for simulation with visualisation.
@@ -84,6 +118,9 @@ class BioSim:
         img_no are consecutive image numbers starting from 0.
     img_fmt : str, default 'png'
         File type for figure/images saved.
+    visualize : bool, default True
+        If False, no plots are drawn and matplotlib is never imported;
+        the simulation itself runs unchanged. Useful for batch runs.
 
     Attributes
     ----------
@@ -114,8 +151,16 @@ class BioSim:
 
     def __init__(self, island_map, ini_pop, seed, ymax_animals=None,
                  cmax_animals=None, hist_specs=None, img_base=None,
-                 img_fmt='png'):
-        np.random.seed(seed)  # random generator
+                 img_fmt='png', visualize=True):
+        # the simulation draws from both RNGs: numpy for the batched
+        # rolls, the random module for shuffles and scalar fallbacks -
+        # seed both or runs are not reproducible
+        np.random.seed(seed)
+        random.seed(seed)
+        # the pooled birth weights were drawn under whatever seed came
+        # before; drop them or same-seed runs diverge
+        Herbivore.reset_birth_pool()
+        Carnivore.reset_birth_pool()
         self.island = Island(ini_pop=ini_pop, geogr=island_map)  # island simulated
 
         if img_base is not None and not isinstance(img_base, str):
@@ -138,10 +183,19 @@ class BioSim:
             # Sjekke at verdi er positiv
 
 
-        # private methods used to visualize the simulation in :meth: simulate()
-        self._graphics = Graphics(ymax_animals=ymax_animals,cmax_animals=cmax_animals,
-                                  hist_specs=hist_specs, img_base=img_base, img_fmt=img_fmt)
-        self._map = np.array([[char for char in row] for row in island_map.split()])
+        # private methods used to visualize the simulation in :meth: simulate().
+        # Graphics is imported lazily: pulling in matplotlib costs a few
+        # hundred ms that batch runs with visualize=False never need to pay
+        self._visualize = visualize
+        if visualize:
+            from .graphics import Graphics
+            self._graphics = Graphics(ymax_animals=ymax_animals,cmax_animals=cmax_animals,
+                                      hist_specs=hist_specs, img_base=img_base, img_fmt=img_fmt)
+        else:
+            self._graphics = _NullGraphics()
+        # the plotting code only needs the rows; keeping the row strings
+        # avoids building one Python object per map character
+        self._map = island_map.split()
         self._final_step = None
         self.year = 0
 
@@ -201,11 +255,10 @@ class BioSim:
                 - 'DeltaPhiMax'
 
         """
-        species = species.title()
-        if species not in self._species_mapping.keys():
+        species_cls = self._species_mapping.get(species.title())
+        if species_cls is None:
             raise ValueError('Species is not defined. The species must be either Herbivore or Carnivore')
-        species = self._species_mapping[species]
-        species.set_params(anim_param)
+        species_cls.set_params(anim_param)
 
     def set_landscape_parameters(self, land_type, land_param):
         """
@@ -223,11 +276,10 @@ class BioSim:
                 - 'f_max'
 
         """
-        land_type = land_type.upper()
-        if land_type not in self.island.landscape_mapping.keys():
+        land_cls = self.island.landscape_mapping.get(land_type.upper())
+        if land_cls is None:
             raise ValueError('Landscape is not defined. The Landscape must be either L, H, D or W')
-        land_type = self.island.landscape_mapping[land_type]
-        land_type.set_param(land_param)
+        land_cls.set_param(land_param)
 
     def simulate(self, num_years, vis_years=1, img_years=None):
         """Run simulation while visualizing the result.
@@ -257,14 +309,47 @@ class BioSim:
         self._graphics.setup(self._final_step, img_years, self._map)
 
         while self.year < self._final_step:
-            self.island.annual_cycle()
-            self.year += 1
+            # run straight through to the next vis tick (or the end) so the
+            # year is tested against vis_years once per block, not per lap
+            stop = min(self._final_step,
+                       self.year + vis_years - self.year % vis_years)
+            for _ in range(stop - self.year):
+                self.island.annual_cycle()
+            self.year = stop
+
+            if self._visualize and self.year % vis_years == 0:
+                counts, matrices, data_hist = self.island.snapshot()
+                self._graphics.update(self.year, counts, matrices, data_hist)
+
+    @classmethod
+    def run_ensemble(cls, configs, num_years, n_workers=None):
+        """
+        Run many independent simulations in parallel worker processes.
+
+        The simulations share nothing, so a parameter sweep scales with
+        the number of cores. Each config dict holds the keyword
+        arguments for one :class:`BioSim`; give each its own ``seed``
+        to keep every replicate reproducible. Visualization defaults
+        to off in the workers unless a config asks for it.
 
-            if self.year % vis_years == 0:
-                self._graphics.update(self.year,
-                                      self.island.anim_count(),
-                                      self.island.anim_matrix(),
-                                      self.island.hist_data())
+        Parameters
+        ----------
+        configs : list of dict
+            One dict of :class:`BioSim` keyword arguments per run.
+        num_years : int
+            Number of years to simulate in every run.
+        n_workers : int, optional
+            Worker process count (default: one per CPU).
+
+        Returns
+        -------
+        list of dict
+            ``num_animals_per_species`` of each run, in config order.
+
+        """
+        with futures.ProcessPoolExecutor(max_workers=n_workers) as pool:
+            return list(pool.map(_run_single,
+                                 configs, [num_years] * len(configs)))
 
     def make_movie(self, movie_fmt=None):
         """
@@ -302,4 +387,5 @@ class BioSim:
             Number of animals per species in island
 
         """
-        return {'Herbivore': self.island.anim_count()[0], 'Carnivore': self.island.anim_count()[1]}
+        num_herb, num_carn = self.island.anim_count()
+        return {'Herbivore': num_herb, 'Carnivore': num_carn}
@@ -15,6 +15,19 @@ import random
 import scipy.stats as stats
 
 
+@pytest.fixture(autouse=True)
+def restore_params():
+    """Some tests mutate the class-level param dicts; put them back"""
+    snap_herb = Herbivore.param.copy()
+    snap_carn = Carnivore.param.copy()
+    yield
+    Herbivore.param.update(snap_herb)
+    Carnivore.param.update(snap_carn)
+    # restoring bypasses set_params, so re-derive the cached values
+    Herbivore._refresh_derived()
+    Carnivore._refresh_derived()
+
+
 def test_input_age_weight():
     """Test for input"""
     h = Herbivore(3, 40)
@@ -173,12 +173,14 @@ def test_add_population(plain_sim):
                                        {'species': 'Carnivore', 'age': 1, 'weight': 10.}]}])
 
 
+@pytest.mark.slow
 def test_simulate(plain_sim):
     """Test that simulation can be called with visualization step values"""
 
     plain_sim.simulate(num_years=10, vis_years=100, img_years=100)
 
 
+@pytest.mark.slow
 def test_multi_simulate(plain_sim):
     """Test that simulation can be called repeatedly"""
 
@@ -234,6 +236,7 @@ def figfile_root():
         os.remove(f)
 
 
+@pytest.mark.slow
 def test_figure_saved(figfile_root):
     """Test that figures are saved during simulation"""
 
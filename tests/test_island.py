@@ -12,23 +12,20 @@ __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 from biosim.island import Island
 import pytest
 
+#: island geography shared by both fixture classes
+_GEOGR = "WWWWW\nWLLLW\nWLLLW\nWLLLW\nWWWWW"
+
 
 class TestIsland:
     @pytest.fixture(autouse=True)
     def create_island(self):
         """Create a default island"""
-        geogr = """\
-                        WWWWW
-                        WLLLW
-                        WLLLW
-                        WLLLW
-                        WWWWW"""
         ini_pop = [{'loc': (3, 3),
-                    'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50} for _ in range(100)]},
+                    'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50}] * 100},
                    {'loc': (3, 3),
-                    'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50} for _ in range(100)]}
+                    'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50}] * 100}
                    ]
-        self.island = Island(ini_pop, geogr)
+        self.island = Island(ini_pop, _GEOGR)
 
     def test_num_animals(self):
         """Test that the number of animals on the island is correct"""
@@ -71,18 +68,12 @@ class TestMigration:
     @pytest.fixture(autouse=True)
     def create_island(self):
         """Create a default island"""
-        geogr = """\
-                            WWWWW
-                            WLLLW
-                            WLLLW
-                            WLLLW
-                            WWWWW"""
         ini_pop = [{'loc': (3, 3),
-                    'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50} for _ in range(100)]},
+                    'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50}] * 100},
                    {'loc': (3, 3),
-                    'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50} for _ in range(100)]}
+                    'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50}] * 100}
                    ]
-        self.island = Island(ini_pop, geogr)
+        self.island = Island(ini_pop, _GEOGR)
 
         # Running migration for one year
         self.island.annual_migration()
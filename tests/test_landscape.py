@@ -11,22 +11,38 @@ __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 from biosim.landscape import Lowland
 from biosim.animals import Herbivore
 import pytest
-from scipy.stats import binom_test
+from math import comb
+
+
+def _binom_test(k, n, p):
+    """Two-sided exact binomial p-value.
+
+    Sums the probability of every outcome no more likely than observing
+    k successes, like scipy.stats.binom_test did, but with math.comb so
+    the test module does not pay the scipy import for one p-value.
+    """
+    pmf = [comb(n, i) * p ** i * (1 - p) ** (n - i) for i in range(n + 1)]
+    cutoff = pmf[k] * (1 + 1e-9)  # tolerate float noise in the comparison
+    return min(1.0, sum(prob for prob in pmf if prob <= cutoff))
 
 
 class TestGeneralAndFeeding:
-    @pytest.fixture(autouse=True)
-    def create_anims(self):
-        """Create default animals"""
-        self.herb_ini = [dict(species='Herbivore', age=5, weight=20) for _ in range(10)]
-        carn_pop = [dict(species='Carnivore', age=5, weight=50) for _ in range(5)]
-        self.land = Lowland(self.herb_ini)
-        self.land.add_land_pop(carn_pop)
+    # add_land_pop only reads the dicts, so one shared template per list is safe
+    _HERB = {'species': 'Herbivore', 'age': 5, 'weight': 20}
+    _CARN = {'species': 'Carnivore', 'age': 5, 'weight': 50}
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def create_anims(cls):
+        """Create default animals once; these tests only read the cell"""
+        cls.herb_ini = [cls._HERB] * 10
+        carn_pop = [cls._CARN] * 5
+        cls.land = Lowland(cls.herb_ini)
+        cls.land.add_land_pop(carn_pop)
 
     def test_lowland_herbivore(self):
         """Test if all animals created are Herbivores"""
-        for herb in self.land.herb_pop:
-            assert isinstance(herb, Herbivore)
+        assert all(isinstance(herb, Herbivore) for herb in self.land.herb_pop)
 
     def test_landscape_get_num_herbivore(self):
         """Testing the number of animals in the cell"""
@@ -35,75 +51,81 @@ class TestGeneralAndFeeding:
 
     def test_herb_weight(self):
         """Test that the weight is correct"""
-        for herb in self.land.herb_pop:
-            assert herb.weight == 20
+        assert all(herb.weight == 20 for herb in self.land.herb_pop)
 
     def test_weight_gain(self):
         """Animals shall gain weight when eating"""
         land = Lowland(self.herb_ini)
-        for herb in land.herb_pop:
-            weight = herb.weight
-            land.feeding()
-            assert herb.weight > weight
+        # snapshot by id: feeding shuffles the population list
+        weight_before = {id(herb): herb.weight for herb in land.herb_pop}
+        land.feeding()
+        assert all(herb.weight > weight_before[id(herb)] for herb in land.herb_pop)
 
     def test_herb_weight_gain(self):
         """The weight shall be gain with: fodder * beta = 10 * 0,9 += 9"""
         land = Lowland(self.herb_ini)
         land.feeding()
-        for herb in land.herb_pop:
-            assert herb.weight == 29.0
+        assert all(herb.weight == 29.0 for herb in land.herb_pop)
 
 
 class TestAgingDying:
+    _HERB = {'species': 'Herbivore', 'age': 5, 'weight': 20}
+    _CARN = {'species': 'Carnivore', 'age': 5, 'weight': 20}
+
     @pytest.fixture(autouse=True)
     def create_anims(self):
         """Create default animals"""
-        self.herb_ini = [
-            dict(species='Herbivore', age=5, weight=20) for _ in range(10)]
-        carn_pop = [
-            dict(species='Carnivore', age=5, weight=20) for _ in range(5)]
+        self.herb_ini = [self._HERB] * 10
+        carn_pop = [self._CARN] * 5
         self.land = Lowland(self.herb_ini)
         self.land.add_land_pop(carn_pop)
 
-    def test_aging_animalpop(self, mocker):
+    def test_aging_animalpop(self, monkeypatch):
         """
         Test that:
          - The age change is correct
          - The age_change method is called the same amount of times as the
            number of animals
         """
-        mocker.spy(Herbivore, 'age_change')
+        calls = [0]
+        orig_age_change = Herbivore.age_change
+
+        def counting_age_change(animal, *args, **kwargs):
+            calls[0] += 1
+            return orig_age_change(animal, *args, **kwargs)
+
+        monkeypatch.setattr(Herbivore, 'age_change', counting_age_change)
         self.land.aging()
-        assert [animal.age == 6 for animal in self.land.herb_pop]
-        assert Herbivore.age_change.call_count == self.land.pop_count_herb()
+        assert all(animal.age == 6 for animal in self.land.herb_pop)
+        assert calls[0] == len(self.land.herb_pop)
 
     def test_dying_animal(self):
         """Test that some animals will dye"""
-        for index, animal in enumerate(self.land.herb_pop):
-            if index == 1:
-                animal.weight = 0
+        self.land.herb_pop[1].weight = 0
         self.land.death()
-        assert self.land.pop_count_herb() <= 9
+        assert len(self.land.herb_pop) <= 9
 
     def test_death(self):
         """Statistical test for death of carnivores"""
         p = 0.21515313753945986
         alpha = 0.01
-        carn_num = self.land.pop_count_carn()
+        carn_num = len(self.land.carn_pop)
         self.land.death()
-        died_carn = carn_num - self.land.pop_count_carn()
+        survivors = len(self.land.carn_pop)
+        died_carn = carn_num - survivors
 
-        assert binom_test(died_carn, carn_num, p) > alpha
+        assert _binom_test(died_carn, carn_num, p) > alpha
 
 
 class TestProcreation:
+    _HERB = {'species': 'Herbivore', 'age': 5, 'weight': 35}
+
     def test_procreation(self):
         """Testing that procreation gives more animals in cell"""
-        test_init_pop = [
-            dict(species='Herbivore', age=5, weight=35) for _ in range(50)]
+        test_init_pop = [self._HERB] * 50
         land = Lowland(test_init_pop)
         for _ in range(2):
-            num_herb = land.pop_count_herb()
+            num_herb = len(land.herb_pop)
             land.procreation()
             land.feeding()
-            assert land.pop_count_herb() > num_herb
+            assert len(land.herb_pop) > num_herb
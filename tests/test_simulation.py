@@ -10,119 +10,99 @@ __email__ = 'therese.knapskog@nmbu.no and astridmo@nmbu.no'
 
 from biosim.simulation import BioSim
 from biosim.animals import Herbivore, Carnivore
-from biosim.landscape import Highland
+from biosim.landscape import Highland, Lowland
 import pytest
 
+#: island geography shared by every fixture in this module
+_GEOGR = "WWWWW\nWLLLW\nWLLLW\nWLLLW\nWWWWW"
+
+#: animal templates; the constructors only read them, so they can be shared
+_HERB = {'species': 'Herbivore', 'age': 5, 'weight': 50}
+_CARN = {'species': 'Carnivore', 'age': 5, 'weight': 50}
+
 
 class TestParamsAnimLand:
 
-    @pytest.fixture(autouse=True)
-    def create_island(self):
-        """Create default island"""
-        geogr = """\
-                                WWWWW
-                                WLLLW
-                                WLLLW
-                                WLLLW
-                                WWWWW"""
-        init_pop = [{'loc': (3, 3),
-                     'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50} for _ in range(100)]},
-                    {'loc': (3, 3),
-                     'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50} for _ in range(100)]}
-                    ]
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def create_island(cls):
+        """Create default island once for the whole class"""
+        init_pop = [{'loc': (3, 3), 'pop': [_HERB] * 100},
+                    {'loc': (3, 3), 'pop': [_CARN] * 100}]
         seed = 150
-        self.sim = BioSim(seed=seed, ini_pop=init_pop, island_map=geogr)
+        cls.sim = BioSim(seed=seed, ini_pop=init_pop, island_map=_GEOGR)
 
-    @pytest.mark.parametrize('new_param, species',
-                             [({'zeta': 3.2, 'xi': 1.8}, "NoSpecies"), ({'notExist': 1.2}, "Herbivore")])
-    def test_animparam_valueerrors(self, new_param, species):
+    @pytest.fixture(autouse=True)
+    def restore_params(self):
+        """The param dicts are class state; put them back after each test"""
+        snap_herb = Herbivore.param.copy()
+        snap_carn = Carnivore.param.copy()
+        snap_high = Highland.param.copy()
+        snap_low = Lowland.param.copy()
+        yield
+        Herbivore.param.update(snap_herb)
+        Carnivore.param.update(snap_carn)
+        Highland.param.update(snap_high)
+        Lowland.param.update(snap_low)
+        # restoring bypasses set_params, so re-derive the cached values
+        Herbivore._refresh_derived()
+        Carnivore._refresh_derived()
+
+    @pytest.mark.parametrize('setter, target, new_param',
+                             [('set_animal_parameters', "NoSpecies", {'zeta': 3.2, 'xi': 1.8}),
+                              ('set_animal_parameters', "Herbivore", {'notExist': 1.2}),
+                              ('set_animal_parameters', "Herbivore", {'zeta': "tre"}),
+                              ('set_landscape_parameters', "NoLand", {'f_max': 300.0}),
+                              ('set_landscape_parameters', "Lowland", {'no_param': 300}),
+                              ('set_landscape_parameters', "L", {'f_max': -300.0}),
+                              ('set_landscape_parameters', "H", {'f_max': "hundre"})])
+    def test_param_valueerrors(self, setter, target, new_param):
         """
         Raise ValueError if:
-        - Parameter is not defined
-        - Species is not defined
+        - Parameter is not defined, negative or not a number
+        - Species or landscape is not defined
         """
         with pytest.raises(ValueError):
-            self.sim.set_animal_parameters(species, new_param)
+            getattr(self.sim, setter)(target, new_param)
 
-    @pytest.mark.parametrize('land_type, land_param',
-                             [("NoLand", {'f_max': 300.0}), ("Lowland", {'no_param': 300})])
-    def test_landparam_valueerrors(self, land_type, land_param):
+    @pytest.mark.parametrize('species, new_param, key, expected',
+                             [("Herbivore", {'zeta': 3.2, 'xi': 1.8}, 'xi', 1.8),
+                              ("Herbivore", {'zeta': 3}, 'zeta', 3.0),
+                              ("HERBivore", {'zeta': 3}, 'zeta', 3.0)])
+    def test_animal_param_ok(self, species, new_param, key, expected):
         """
-        Raise ValueError if:
-        - Parameter is not defined
-        - Landscape is not defined
+        Test that valid parameters are stored as floats on the right
+        species (typing mistakes in the species name included), and
+        that the other species is untouched
         """
-        with pytest.raises(ValueError):
-            self.sim.set_landscape_parameters(land_type, land_param)
-
-    def test_neg_land_param(self):
-        """Test that negative values for parameters raises error"""
-        land_type = "L"
-        land_param = {'f_max': -300.0}
-        with pytest.raises(ValueError):
-            self.sim.set_landscape_parameters(land_type, land_param)
-
-    def test_param_herbivore(self):
-        """Test that parameters are updated correctly for herbivores, and not changing for carnivores"""
-        new_params = {'zeta': 3.2, 'xi': 1.8}
-        species = "Herbivore"
-        self.sim.set_animal_parameters(species, new_params)
-        assert Herbivore.param['zeta'] == 3.2 and Herbivore.param['xi'] == 1.8
+        self.sim.set_animal_parameters(species, new_param)
+        assert Herbivore.param[key] == expected
+        assert isinstance(Herbivore.param[key], float)
         assert Carnivore.param['zeta'] == 3.5 and Carnivore.param['xi'] == 1.1
 
-    def test_float_param(self):
-        """Test that all params are float. Input params will be made float"""
-        new_anim_param = {'zeta': 3}
-        species = "Herbivore"
-        land_type = "H"
-        self.sim.set_animal_parameters(species, new_anim_param)
-        assert isinstance(Herbivore.param['zeta'], float)
-
-    def test_type_error(self):
-        """Test that wrong input for parameters raises error"""
-        new_anim_param = {'zeta': "tre"}
-        new_land_param = {'f_max': "hundre"}
-        species = "Herbivore"
-        land_type = "H"
-        with pytest.raises(ValueError):
-            self.sim.set_animal_parameters(species, new_anim_param)
-        with pytest.raises(ValueError):
-            self.sim.set_landscape_parameters(land_type, new_land_param)
-
-    def test_typing_mistake(self):
-        """
-        Test that typing mistake for input of parameters correct the mistake,
-        and that parameters is sat to the correct value
-        ."""
-        new_anim_param = {'zeta': 3}
-        new_land_param = {'f_max': 300}
-        species = "HERBivore"
-        land_type = "h"
-        self.sim.set_animal_parameters(species, new_anim_param)
-        self.sim.set_landscape_parameters(land_type, new_land_param)
-        assert Herbivore.param['zeta'] == 3.0
+    @pytest.mark.parametrize('land_type', ["H", "h"])
+    def test_land_param_ok(self, land_type):
+        """Test that valid landscape parameters are stored, case-insensitively"""
+        self.sim.set_landscape_parameters(land_type, {'f_max': 300})
         assert Highland.param['f_max'] == 300
 
 
 class TestOtherParams:
 
-    @pytest.fixture(autouse=True)
-    def create_island(self):
-        """Create default island"""
-        self.geogr = """\
-                                    WWWWW
-                                    WLLLW
-                                    WLLLW
-                                    WLLLW
-                                    WWWWW"""
-        self.init_pop = [{'loc': (3, 3),
-                         'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 50} for _ in range(100)]},
-                         {'loc': (3, 3),
-                          'pop': [{'species': 'Carnivore', 'age': 5, 'weight': 50} for _ in range(100)]}]
-        self.seed = 150
-
-    def test_ymax_cmaxanimals(self):
-        """Test that the ymax raises error if input is negative"""
-        ymax_animals = -1000
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def create_island(cls):
+        """Store the island ingredients once for the whole class"""
+        cls.geogr = _GEOGR
+        cls.init_pop = [{'loc': (3, 3), 'pop': [_HERB] * 100},
+                        {'loc': (3, 3), 'pop': [_CARN] * 100}]
+        cls.seed = 150
+
+    @pytest.mark.parametrize('kwargs', [{'ymax_animals': -1000},
+                                        {'cmax_animals': {'Herbivore': -50}},
+                                        {'cmax_animals': {'NoSpecies': 50}},
+                                        {'img_base': 42}])
+    def test_invalid_kwargs(self, kwargs):
+        """Test that negative plot limits and bad keyword inputs raise ValueError"""
         with pytest.raises(ValueError):
-            BioSim(island_map=self.geogr, ini_pop=self.init_pop, seed=self.seed, ymax_animals=ymax_animals)
\ No newline at end of file
+            BioSim(island_map=self.geogr, ini_pop=self.init_pop, seed=self.seed, **kwargs)
\ No newline at end of file